@@ -1,8 +1,20 @@
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 class User(AbstractUser):
     is_admin = models.BooleanField(default=True)
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # pg_trgm: search_fields do UserViewSet/admin. icontains vira UPPER(col) LIKE
+            # UPPER('%x%') e o SearchFilter junta as colunas com OR: 1 índice UPPER(col) por coluna
+            GinIndex(OpClass(Upper("username"), name="gin_trgm_ops"), name="user_username_trgm_idx"),
+            GinIndex(OpClass(Upper("email"), name="gin_trgm_ops"), name="user_email_trgm_idx"),
+            GinIndex(OpClass(Upper("first_name"), name="gin_trgm_ops"), name="user_first_name_trgm_idx"),
+            GinIndex(OpClass(Upper("last_name"), name="gin_trgm_ops"), name="user_last_name_trgm_idx"),
+        ]
+
     def __str__(self):
         return self.username
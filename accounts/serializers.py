@@ -2,10 +2,12 @@ from django.contrib.auth import get_user_model
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
+from common.serializers import CachedFieldsModelSerializer
+
 User = get_user_model()
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedFieldsModelSerializer):
     # senha nunca sai na resposta; opcional no update, obrigatória no create
     password = serializers.CharField(write_only=True, required=False, min_length=6)
 
@@ -39,8 +41,10 @@ class UserSerializer(serializers.ModelSerializer):
         new_is_admin = validated_data.pop("is_admin", None)
 
         # atualiza campos “normais”
+        dirty = set()
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
+            dirty.add(attr)
 
         # proteção: não permitir que o próprio usuário remova seu admin
         if (
@@ -54,13 +58,16 @@ class UserSerializer(serializers.ModelSerializer):
             )
 
         if new_is_admin is not None:
-            instance.is_admin = bool(new_is_admin)
-            instance.is_staff = bool(new_is_admin)
+            instance.is_admin = instance.is_staff = bool(new_is_admin)
+            dirty.update(("is_admin", "is_staff"))
 
         if new_password:
             instance.set_password(new_password)
+            dirty.add("password")
 
-        instance.save()
+        # UPDATE só das colunas alteradas (nada alterado = nenhum UPDATE)
+        if dirty:
+            instance.save(update_fields=sorted(dirty))
         return instance
 
 
@@ -83,7 +90,8 @@ class TokenObtainPairWithUserSerializer(TokenObtainPairSerializer):
         return {
             "accessToken": data["access"],
             "refreshToken": data["refresh"],
-            "user": UserSerializer(self.user).data,
+            # dict simples: campos do UserSerializer já vêm do cache por classe
+            "user": dict(UserSerializer(self.user).data),
         }
 
 
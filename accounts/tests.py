@@ -0,0 +1,173 @@
+import re
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import serializers, status
+from rest_framework.test import APIClient
+
+from .models import User
+from .serializers import TokenObtainPairWithUserSerializer, UserSerializer
+
+
+class UserSerializerCamposTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="fulano", password="segredo1", email="f@x.com")
+
+    def test_campos_montados_uma_vez_por_classe(self):
+        UserSerializer._fields_cache.pop(UserSerializer, None)
+        with mock.patch.object(
+            serializers.ModelSerializer, "get_fields", autospec=True,
+            side_effect=serializers.ModelSerializer.get_fields,
+        ) as get_fields:
+            a, b = UserSerializer(self.user), UserSerializer(self.user)
+            self.assertEqual(a.data, b.data)
+        self.assertEqual(get_fields.call_count, 1)
+        # cada instância recebe cópias ligadas a ela (o cache não guarda o bind)
+        self.assertIsNot(a.fields["username"], b.fields["username"])
+        self.assertIs(a.fields["username"].parent, a)
+        self.assertIs(b.fields["username"].parent, b)
+
+    def test_senha_nunca_sai_na_resposta(self):
+        data = UserSerializer(self.user).data
+        self.assertNotIn("password", data)
+        self.assertEqual(data["username"], "fulano")
+
+
+class UsersApiTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(username="admin", password="segredo1", is_admin=True)
+        cls.outro = User.objects.create_user(
+            username="beltrano", password="segredo1", first_name="Bel", is_admin=False
+        )
+
+    def setUp(self):
+        self.api = APIClient()
+        self.api.force_authenticate(self.admin)
+
+    def sql_de(self, method, url, data=None):
+        with CaptureQueriesContext(connection) as ctx:
+            r = getattr(self.api, method)(url, data, format="json")
+        return r, [q["sql"] for q in ctx.captured_queries]
+
+    def colunas_gravadas(self, sqls):
+        """Colunas do SET de cada UPDATE em accounts_user (em ordem alfabética)."""
+        return [
+            sorted(re.findall(r'"(\w+)" = ', sql.split(" WHERE ")[0]))
+            for sql in sqls if sql.startswith('UPDATE "accounts_user"')
+        ]
+
+
+class UserViewSetProjecaoTests(UsersApiTestCase):
+    def test_leitura_nao_carrega_hash_de_senha(self):
+        r, sqls = self.sql_de("get", f"/api/accounts/users/{self.outro.pk}/")
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+        self.assertEqual(r.json()["first_name"], "Bel")
+        self.assertFalse(any('"password"' in sql for sql in sqls), sqls)
+
+    def test_escrita_trabalha_com_a_linha_completa(self):
+        r = self.api.patch(f"/api/accounts/users/{self.outro.pk}/", {"last_name": "Silva"}, format="json")
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+        self.outro.refresh_from_db()
+        self.assertEqual(self.outro.last_name, "Silva")
+        self.assertTrue(self.outro.check_password("segredo1"))
+
+
+class UserViewSetListagemTests(UsersApiTestCase):
+    def test_listagem_por_values_igual_ao_serializer(self):
+        with self.assertNumQueries(1):
+            r = self.api.get("/api/accounts/users/")
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+        esperado = [UserSerializer(u).data for u in User.objects.order_by("username")]
+        self.assertEqual(r.json(), esperado)
+
+    def test_busca(self):
+        r = self.api.get("/api/accounts/users/", {"search": "beltr"})
+        self.assertEqual([u["username"] for u in r.json()], ["beltrano"])
+
+
+class SenhaGravaSoAColunaTests(UsersApiTestCase):
+    def test_set_password(self):
+        r, sqls = self.sql_de("post", f"/api/accounts/users/{self.outro.pk}/set-password/", {"new_password": "nova123"})
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.colunas_gravadas(sqls), [["password"]])
+        self.outro.refresh_from_db()
+        self.assertTrue(self.outro.check_password("nova123"))
+
+    def test_change_password(self):
+        self.api.force_authenticate(self.outro)
+        r, sqls = self.sql_de(
+            "post", "/api/auth/change-password/", {"old_password": "segredo1", "new_password": "nova12345"}
+        )
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.colunas_gravadas(sqls), [["password"]])
+
+    def test_update_grava_as_colunas_alteradas(self):
+        r, sqls = self.sql_de(
+            "patch", f"/api/accounts/users/{self.outro.pk}/", {"first_name": "B", "password": "nova123"}
+        )
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.colunas_gravadas(sqls), [["first_name", "password"]])
+
+
+class LoginTests(UsersApiTestCase):
+    def test_login_devolve_tokens_e_usuario(self):
+        r = APIClient().post("/api/auth/login/", {"username": "beltrano", "password": "segredo1"}, format="json")
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+        body = r.json()
+        self.assertEqual(set(body), {"accessToken", "refreshToken", "user"})
+        self.assertEqual(body["user"], UserSerializer(self.outro).data)
+
+    def test_usuario_vem_como_dict_simples(self):
+        s = TokenObtainPairWithUserSerializer(data={"username": "beltrano", "password": "segredo1"})
+        self.assertTrue(s.is_valid())
+        self.assertIs(type(s.validated_data["user"]), dict)
+
+
+class UserUpdateSoAlteradosTests(UsersApiTestCase):
+    def test_patch_vazio_nao_grava(self):
+        r, sqls = self.sql_de("patch", f"/api/accounts/users/{self.outro.pk}/", {})
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.colunas_gravadas(sqls), [])
+
+    def test_patch_grava_so_o_campo(self):
+        r, sqls = self.sql_de("patch", f"/api/accounts/users/{self.outro.pk}/", {"first_name": "Beto"})
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.colunas_gravadas(sqls), [["first_name"]])
+
+    def test_is_admin_acompanha_is_staff(self):
+        r, sqls = self.sql_de("patch", f"/api/accounts/users/{self.outro.pk}/", {"is_admin": True})
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.colunas_gravadas(sqls), [["is_admin", "is_staff"]])
+        self.outro.refresh_from_db()
+        self.assertTrue(self.outro.is_staff)
+
+    def test_nao_remove_o_proprio_admin(self):
+        r, sqls = self.sql_de("patch", f"/api/accounts/users/{self.admin.pk}/", {"is_admin": False})
+        self.assertEqual(r.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.colunas_gravadas(sqls), [])
+
+
+class MeETagTests(UsersApiTestCase):
+    def test_get_condicional(self):
+        r = self.api.get("/api/auth/me/")
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+        self.assertEqual(r.json()["username"], "admin")
+        etag = r["ETag"]
+        self.assertTrue(etag.startswith('W/"'))
+
+        # comparação fraca: com ou sem W/, e "*"
+        for inm in (etag, etag.removeprefix("W/"), "*"):
+            r = self.api.get("/api/auth/me/", HTTP_IF_NONE_MATCH=inm)
+            self.assertEqual(r.status_code, status.HTTP_304_NOT_MODIFIED, inm)
+            self.assertEqual(r["ETag"], etag)
+
+        self.admin.first_name = "Novo"
+        self.admin.save(update_fields=["first_name"])
+        r = self.api.get("/api/auth/me/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+        self.assertEqual(r.json()["first_name"], "Novo")
+        self.assertNotEqual(r["ETag"], etag)
@@ -1,22 +1,40 @@
 # Views de usuário podem ser adicionadas aqui (perfil, troca de senha, etc.)
+import hashlib
+
+from django.utils.http import parse_etags
 from rest_framework.views import APIView
 from rest_framework import viewsets, filters, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from .serializers import UserSerializer
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
-from .serializers import TokenObtainPairWithUserSerializer
 from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
 
 from .models import User
-from .serializers import UserSerializer
+from .serializers import UserSerializer, TokenObtainPairWithUserSerializer, ChangePasswordSerializer
 from .permissions import IsAdmin
 
+# Campos que o UserSerializer expõe na leitura (password é write-only)
+USER_READ_FIELDS = (
+    "id", "username", "first_name", "last_name", "email", "is_admin", "is_active",
+)
+
+
+def _user_etag(user) -> str:
+    """ETag fraco derivado só dos campos expostos: muda sempre que a resposta mudaria."""
+    raw = "|".join(str(getattr(user, f)) for f in USER_READ_FIELDS)
+    return f'W/"{hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()}"'
+
+
 class MeView(APIView):
     permission_classes = [IsAuthenticated]
     def get(self, request):
-        return Response(UserSerializer(request.user).data)
+        # polling do front: If-None-Match igual => 304 sem serializar
+        etag = _user_etag(request.user)
+        etags = parse_etags(request.META.get("HTTP_IF_NONE_MATCH", ""))
+        if "*" in etags or etag.removeprefix("W/") in {e.removeprefix("W/") for e in etags}:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        return Response(UserSerializer(request.user).data, headers={"ETag": etag})
 
 class LoginView(TokenObtainPairView):
     serializer_class = TokenObtainPairWithUserSerializer
@@ -34,7 +52,6 @@ class ChangePasswordView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
-        from .serializers import ChangePasswordSerializer
         ser = ChangePasswordSerializer(data=request.data)
         ser.is_valid(raise_exception=True)
 
@@ -43,17 +60,33 @@ class ChangePasswordView(APIView):
             return Response({"detail": "Senha atual incorreta."}, status=status.HTTP_400_BAD_REQUEST)
 
         user.set_password(ser.validated_data["new_password"])
-        user.save()
+        user.save(update_fields=["password"])
         return Response({"detail": "Senha alterada com sucesso."})
 
 class UserViewSet(viewsets.ModelViewSet):
-    queryset = User.objects.all().order_by("username")
+    # projeção só com o que o UserSerializer expõe (sem hash de senha, datas etc.)
+    queryset = User.objects.only(*USER_READ_FIELDS).order_by("username")
     serializer_class = UserSerializer
     permission_classes = [IsAdmin]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ["username", "email", "first_name", "last_name"]
     ordering_fields = ["username", "date_joined", "is_admin", "is_active"]
 
+    def get_queryset(self):
+        # escrita (senha/is_staff) trabalha com a linha completa
+        if self.action in ("update", "partial_update", "set_password"):
+            return User.objects.all().order_by("username")
+        return super().get_queryset()
+
+    def list(self, request, *args, **kwargs):
+        # listagem é só leitura de campos escalares: dict do banco direto na resposta,
+        # sem instanciar User nem passar pelo UserSerializer
+        qs = self.filter_queryset(self.get_queryset()).values(*USER_READ_FIELDS)
+        page = self.paginate_queryset(qs)
+        if page is not None:
+            return self.get_paginated_response(list(page))
+        return Response(list(qs))
+
     def perform_destroy(self, instance):
         if self.request.user.pk == instance.pk:
             raise ValidationError({"detail": "Você não pode excluir a si mesmo."})
@@ -67,5 +100,5 @@ class UserViewSet(viewsets.ModelViewSet):
             return Response({"new_password": "Mínimo de 6 caracteres."},
                             status=status.HTTP_400_BAD_REQUEST)
         user.set_password(new_password)
-        user.save()
+        user.save(update_fields=["password"])
         return Response({"detail": "Senha alterada com sucesso."})
@@ -1,7 +1,25 @@
+from django import forms
 from django.contrib import admin
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import Count, Max
+from django.utils import timezone
+
+from .models import (
+    Cliente,
+    ContaBancaria,
+    ContaBancariaReu,
+    DescricaoBanco,
+    Representante,
+    schedule_refresh_descricao_banco_ativa,
+)
 
-from .models import Cliente, ContaBancaria, ContaBancariaReu, DescricaoBanco, Representante
+
+def _is_changelist(request, model_admin) -> bool:
+    """True se a requisição é da listagem (changelist) do model_admin."""
+    match = getattr(request, "resolver_match", None)
+    opts = model_admin.model._meta
+    return bool(match) and match.url_name == f"{opts.app_label}_{opts.model_name}_changelist"
 
 
 # =========================
@@ -28,6 +46,13 @@ class ClienteAdmin(admin.ModelAdmin):
     list_per_page = 50
     readonly_fields = ("criado_em", "atualizado_em")
 
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        # listagem não mostra o campo legado (TEXT): não trafega a coluna
+        if _is_changelist(request, self):
+            qs = qs.defer("qualificacao")
+        return qs
+
     fieldsets = (
         ("Identificação", {
             "fields": ("nome_completo", "cpf", "rg", "orgao_expedidor"),
@@ -69,8 +94,9 @@ class ContaBancariaAdmin(admin.ModelAdmin):
         "is_principal",
         "criado_em",
     )
-    search_fields = ("cliente__nome_completo", "banco_nome", "banco_codigo", "agencia", "conta")
+    search_fields = ("cliente_nome_cache", "banco_nome", "banco_codigo", "agencia", "conta")
     list_filter = ("tipo", "is_principal", "banco_nome", "banco_codigo")
+    ordering = ("cliente_nome_cache", "banco_nome", "agencia", "conta")
     autocomplete_fields = ("cliente",)
     list_select_related = ("cliente",)  # evita N+1 no changelist
     list_per_page = 50
@@ -80,6 +106,56 @@ class ContaBancariaAdmin(admin.ModelAdmin):
 # =========================
 # Descrição de Banco
 # =========================
+class TopBancosListFilter(admin.SimpleListFilter):
+    """
+    Filtro por banco_id restrito aos bancos com mais descrições.
+    banco_id tem cardinalidade alta: em vez do DISTINCT a cada página,
+    as opções vêm de um GROUP BY limitado e cacheado.
+    """
+    title = "banco (mais usados)"
+    parameter_name = "banco_id"
+    cache_key = "admin:descricaobanco:top_bancos"
+    cache_timeout = 300  # 5 min
+    limit = 20
+
+    def lookups(self, request, model_admin):
+        choices = cache.get(self.cache_key)
+        if choices is None:
+            rows = (
+                DescricaoBanco.objects.values("banco_id")
+                .annotate(total=Count("id"), nome=Max("banco_nome"))
+                .order_by("-total", "banco_id")[: self.limit]
+            )
+            choices = [(r["banco_id"], f"{r['banco_id']} - {r['nome']}") for r in rows]
+            cache.set(self.cache_key, choices, self.cache_timeout)
+        return choices
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(banco_id=self.value())
+        return queryset
+
+
+class DescricaoBancoAdminForm(forms.ModelForm):
+    """
+    uniq_active_per_banco é DEFERRED, mas o validate() do ExclusionConstraint (chamado
+    pelo full_clean do form) ignora o deferrable e recusaria ativar uma 2ª descrição do
+    banco_id. A troca da ativa é feita no save_model: aqui o resto é validado como inativa.
+    """
+
+    class Meta:
+        model = DescricaoBanco
+        fields = "__all__"
+
+    def _post_clean(self):
+        ativa = self.cleaned_data.get("is_ativa", False)
+        self.cleaned_data["is_ativa"] = False
+        try:
+            super()._post_clean()
+        finally:
+            self.cleaned_data["is_ativa"] = self.instance.is_ativa = ativa
+
+
 @admin.register(DescricaoBanco)
 class DescricaoBancoAdmin(admin.ModelAdmin):
     """
@@ -95,12 +171,14 @@ class DescricaoBancoAdmin(admin.ModelAdmin):
     "atualizado_em",
 )
     search_fields = ("banco_id", "banco_nome", "nome_banco", "cnpj", "endereco", "atualizado_por__username")
-    list_filter = ("is_ativa", "banco_nome", "banco_id")
+    list_filter = ("is_ativa", TopBancosListFilter)
     ordering = ("banco_nome", "-is_ativa", "-atualizado_em")
     readonly_fields = ("criado_em", "atualizado_em")
     actions = ("marcar_como_ativa",)
+    form = DescricaoBancoAdminForm
 
     def get_queryset(self, request):
+        # cobre a coluna "atualizado_por" do list_display (sem N+1)
         qs = super().get_queryset(request)
         return qs.select_related("atualizado_por")
 
@@ -109,11 +187,15 @@ class DescricaoBancoAdmin(admin.ModelAdmin):
         # auditoria
         if request.user.is_authenticated:
             obj.atualizado_por = request.user
-        super().save_model(request, obj, form, change)
+        if not (obj.is_ativa and obj.banco_id):
+            super().save_model(request, obj, form, change)
+            return
 
-        # se marcou esta como ativa, desativa as demais do mesmo banco_id
-        if obj.is_ativa and obj.banco_id:
-            DescricaoBanco.objects.filter(banco_id=obj.banco_id).exclude(pk=obj.pk).update(is_ativa=False)
+        # marcou como ativa: grava e desativa as demais do mesmo banco_id (CTE). O
+        # save_and_activate só atualiza linha existente; na inclusão, insere antes
+        if not change:
+            super().save_model(request, obj, form, change)
+        obj.save_and_activate()
 
     @admin.action(description="Marcar como ativa (desativando as demais do mesmo banco)")
     @transaction.atomic
@@ -127,18 +209,28 @@ class DescricaoBancoAdmin(admin.ModelAdmin):
         for obj in queryset:
             by_bank.setdefault(obj.banco_id, []).append(obj)
 
-        total_ativadas = 0
-        for bank_id, rows in by_bank.items():
-            # escolhe a mais recente no queryset
-            chosen = sorted(rows, key=lambda r: (r.atualizado_em, r.pk), reverse=True)[0]
-            # desativa todas daquele banco_id
-            DescricaoBanco.objects.filter(banco_id=bank_id, is_ativa=True).update(is_ativa=False)
-            # ativa a escolhida
+        # escolhe a mais recente no queryset, por banco_id
+        chosen_objs = [
+            max(rows, key=lambda r: (r.atualizado_em, r.pk))
+            for rows in by_bank.values()
+        ]
+
+        # 1 UPDATE: desativa as demais ativas de todos os banco_id envolvidos
+        DescricaoBanco.objects.filter(
+            banco_id__in=list(by_bank.keys()), is_ativa=True
+        ).exclude(pk__in=[c.pk for c in chosen_objs]).update(is_ativa=False)
+
+        # 1 bulk_update: ativa as escolhidas (auto_now não roda no bulk_update)
+        now = timezone.now()
+        for chosen in chosen_objs:
             if request.user.is_authenticated:
                 chosen.atualizado_por = request.user
             chosen.is_ativa = True
-            chosen.save(update_fields=["is_ativa", "atualizado_por", "atualizado_em"])
-            total_ativadas += 1
+            chosen.atualizado_em = now
+        DescricaoBanco.objects.bulk_update(chosen_objs, ["is_ativa", "atualizado_por", "atualizado_em"])
+        # bulk_update não dispara post_save: atualiza a view das ativas manualmente
+        schedule_refresh_descricao_banco_ativa()
+        total_ativadas = len(chosen_objs)
 
         self.message_user(request, f"{total_ativadas} descrição(ões) marcada(s) como ativa(s).")
 
@@ -150,7 +242,7 @@ class DescricaoBancoAdmin(admin.ModelAdmin):
 class RepresentanteAdmin(admin.ModelAdmin):
     list_display = (
         "id",
-        "cliente",
+        "cliente_nome",
         "nome_completo",
         "cpf",
         "cidade",
@@ -168,7 +260,7 @@ class RepresentanteAdmin(admin.ModelAdmin):
         "bairro",
         "profissao",
         "nacionalidade",
-        "cliente__nome_completo",
+        "cliente_nome_cache",
     )
     list_filter = (
         "uf",
@@ -178,13 +270,28 @@ class RepresentanteAdmin(admin.ModelAdmin):
         "se_crianca_adolescente",
         "estado_civil",
     )
-    ordering = ("cliente__nome_completo", "nome_completo")
+    ordering = ("cliente_nome_cache", "nome_completo")
     autocomplete_fields = ("cliente",)
-    list_select_related = ("cliente",)
     list_per_page = 50
     readonly_fields = ("criado_em", "atualizado_em")
     actions = ("usar_endereco_do_cliente",)
 
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        # listagem (GET; o POST das ações recebe as linhas completas): só as colunas
+        # do list_display, com o nome do cliente vindo do cache (sem JOIN)
+        if request.method == "GET" and _is_changelist(request, self):
+            qs = qs.only(
+                "id", "nome_completo", "cpf", "cidade", "uf", "usa_endereco_do_cliente",
+                "se_idoso", "se_incapaz", "se_crianca_adolescente", "criado_em",
+                "cliente_nome_cache",
+            )
+        return qs
+
+    @admin.display(description="Cliente", ordering="cliente_nome_cache")
+    def cliente_nome(self, obj):
+        return obj.cliente_nome_cache
+
     fieldsets = (
         ("Vínculo", {"fields": ("cliente",)}),
         ("Identificação", {"fields": ("nome_completo", "cpf", "rg", "orgao_expedidor")}),
@@ -199,8 +306,10 @@ class RepresentanteAdmin(admin.ModelAdmin):
     @admin.action(description="Copiar endereço do cliente para o(s) representante(s) selecionado(s)")
     @transaction.atomic
     def usar_endereco_do_cliente(self, request, queryset):
-        atualizados = 0
-        for rep in queryset.select_related("cliente"):
+        reps = list(queryset.select_related("cliente"))
+        # auto_now não roda no bulk_update: avançamos atualizado_em manualmente
+        now = timezone.now()
+        for rep in reps:
             c = rep.cliente
             # marca a flag e copia os campos
             rep.usa_endereco_do_cliente = True
@@ -210,12 +319,17 @@ class RepresentanteAdmin(admin.ModelAdmin):
             rep.bairro = c.bairro
             rep.cidade = c.cidade
             rep.uf = c.uf
-            rep.save(update_fields=[
+            rep.atualizado_em = now
+        Representante.objects.bulk_update(
+            reps,
+            [
                 "usa_endereco_do_cliente",
                 "cep", "logradouro", "numero", "bairro", "cidade", "uf",
                 "atualizado_em",
-            ])
-            atualizados += 1
+            ],
+            batch_size=500,
+        )
+        atualizados = len(reps)
         self.message_user(request, f"Endereço copiado para {atualizados} representante(s).")
 
 
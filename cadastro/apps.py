@@ -8,5 +8,4 @@ class CadastroConfig(AppConfig):
 
     def ready(self):
         # Ponto de extensão para signals/hooks futuros.
-        # Ex.: from . import signals  # noqa: F401
-        pass
+        from . import signals  # noqa: F401
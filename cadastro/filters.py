@@ -1,17 +1,37 @@
 # cadastro/filters.py
+import re
+
 import django_filters as df
-from django.db.models import Q
+from django.contrib.postgres.search import SearchQuery
 
-from .models import Cliente, ContaBancaria, DescricaoBanco, Representante
+from common.filters import LazyFilterSet
+from .models import Cliente, ContaBancaria, ContaBancariaReu, Contrato, DescricaoBanco, Representante
 from .validators import only_digits
 
 
+_TERMO_BUSCA_RE = re.compile(r"\w+")
+
+
+def filter_search_vec(queryset, name, value):
+    """
+    Busca textual (FTS) na coluna gerada search_vec: todos os termos, por prefixo
+    ("mar silv" encontra "Maria da Silva"). Termos saneados antes do to_tsquery.
+    """
+    termos = _TERMO_BUSCA_RE.findall(value or "")
+    if not termos:
+        return queryset
+    query = SearchQuery(" & ".join(f"{t}:*" for t in termos), search_type="raw", config="portuguese")
+    return queryset.filter(search_vec=query)
+
+
 # =========================
 # Cliente
 # =========================
-class ClienteFilter(df.FilterSet):
+class ClienteFilter(LazyFilterSet):
     # Busca por nome com "contains" (case-insensitive)
     nome_icontains = df.CharFilter(field_name="nome_completo", lookup_expr="icontains")
+    # Busca textual por termos/prefixos em nome e cidade (índice GIN)
+    nome_search = df.CharFilter(method=filter_search_vec)
     # CPF com normalização (aceita com/sem máscara)
     cpf = df.CharFilter(method="filter_cpf")
     # Cidade parcial
@@ -52,7 +72,7 @@ class ClienteFilter(df.FilterSet):
 # =========================
 # Conta Bancária
 # =========================
-class ContaBancariaFilter(df.FilterSet):
+class ContaBancariaFilter(LazyFilterSet):
     cliente = df.NumberFilter(field_name="cliente_id")
     banco_nome_icontains = df.CharFilter(field_name="banco_nome", lookup_expr="icontains")
     # Filtrar por código COMPE/ISPB curto, caso usado
@@ -72,7 +92,7 @@ class ContaBancariaFilter(df.FilterSet):
 # =========================
 # Descrição de Banco
 # =========================
-class DescricaoBancoFilter(df.FilterSet):
+class DescricaoBancoFilter(LazyFilterSet):
     """
     Filtros para o recurso de descrições por banco (múltiplas por banco_id).
     Agora adaptado aos campos estruturados (nome_banco, cnpj, endereco).
@@ -83,7 +103,7 @@ class DescricaoBancoFilter(df.FilterSet):
 
     # 🔹 novos campos
     nome_banco_icontains = df.CharFilter(field_name="nome_banco", lookup_expr="icontains")
-    cnpj_icontains = df.CharFilter(field_name="cnpj", lookup_expr="icontains")
+    cnpj_icontains = df.CharFilter(method="filter_cnpj_icontains")
     endereco_icontains = df.CharFilter(field_name="endereco", lookup_expr="icontains")
 
     is_ativa = df.BooleanFilter(field_name="is_ativa")
@@ -104,33 +124,35 @@ class DescricaoBancoFilter(df.FilterSet):
             "has_dados",
         ]
 
+    def filter_cnpj_icontains(self, queryset, name, value):
+        """
+        Busca parcial de CNPJ com/sem máscara, na coluna normalizada (cnpj_digits, indexada).
+        Sem dígitos na busca, cai no icontains do valor armazenado.
+        """
+        digits = only_digits(value)
+        if not digits:
+            return queryset.filter(cnpj__icontains=value)
+        return queryset.filter(cnpj_digits__contains=digits)
+
     def filter_has_dados(self, queryset, name, value: bool):
         """
         Permite filtrar registros que possuem algum dado preenchido
         (nome_banco, cnpj ou endereco).
+        Usa a coluna gerada/indexada 'has_dados' do modelo.
         """
-        if value is True:
-            return queryset.exclude(
-                Q(nome_banco__isnull=True) | Q(nome_banco=""),
-                Q(cnpj__isnull=True) | Q(cnpj=""),
-                Q(endereco__isnull=True) | Q(endereco="")
-            )
-        if value is False:
-            return queryset.filter(
-                Q(nome_banco__isnull=True) | Q(nome_banco=""),
-                Q(cnpj__isnull=True) | Q(cnpj=""),
-                Q(endereco__isnull=True) | Q(endereco="")
-            )
-        return queryset
+        if value is None:
+            return queryset
+        return queryset.filter(has_dados=value)
 
 
 # =========================
 # Representante
 # =========================
-class RepresentanteFilter(df.FilterSet):
+class RepresentanteFilter(LazyFilterSet):
     # Identificação / vínculo
     cliente = df.NumberFilter(field_name="cliente_id")
     nome_icontains = df.CharFilter(field_name="nome_completo", lookup_expr="icontains")
+    nome_search = df.CharFilter(method=filter_search_vec)
     cpf = df.CharFilter(method="filter_cpf")
 
     # Endereço / localização
@@ -167,3 +189,21 @@ class RepresentanteFilter(df.FilterSet):
 
     def filter_cpf(self, queryset, name, value):
         return queryset.filter(cpf=only_digits(value or ""))
+
+
+# =========================
+# Conta Bancária do Réu
+# =========================
+class ContaBancariaReuFilter(LazyFilterSet):
+    class Meta:
+        model = ContaBancariaReu
+        fields = ["banco_nome", "banco_codigo", "cidade", "estado"]
+
+
+# =========================
+# Contrato
+# =========================
+class ContratoFilter(LazyFilterSet):
+    class Meta:
+        model = Contrato
+        fields = ["cliente", "template"]
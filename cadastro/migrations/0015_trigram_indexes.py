@@ -0,0 +1,35 @@
+# Generated by Django 5.2.6 on 2026-10-14 17:40
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # também resolve os dois ramos 0007 (merge)
+    dependencies = [
+        ('cadastro', '0007_alter_descricaobanco_options_and_more'),
+        ('cadastro', '0014_contabancariareu_descricao'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='cliente',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('nome_completo'), name='gin_trgm_ops'), name='cli_nome_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cliente',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('cidade'), name='gin_trgm_ops'), name='cli_cidade_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='descricaobanco',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('nome_banco'), name='gin_trgm_ops'), name='descbanco_nome_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='representante',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('nome_completo'), name='gin_trgm_ops'), name='rep_nome_trgm_idx'),
+        ),
+    ]
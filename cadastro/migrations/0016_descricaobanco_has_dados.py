@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-14 17:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastro', '0015_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='descricaobanco',
+            name='has_dados',
+            field=models.GeneratedField(db_index=True, db_persist=True, expression=models.Q(models.Q(('nome_banco__isnull', False), models.Q(('nome_banco', ''), _negated=True)), models.Q(('cnpj__isnull', False), models.Q(('cnpj', ''), _negated=True)), models.Q(('endereco__isnull', False), models.Q(('endereco', ''), _negated=True)), _connector='OR'), output_field=models.BooleanField()),
+        ),
+    ]
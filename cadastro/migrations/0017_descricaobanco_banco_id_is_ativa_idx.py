@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-14 17:44
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastro', '0016_descricaobanco_has_dados'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='descricaobanco',
+            index=models.Index(fields=['banco_id', 'is_ativa'], name='descbanco_bi_ativa_idx'),
+        ),
+    ]
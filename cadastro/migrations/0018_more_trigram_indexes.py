@@ -0,0 +1,55 @@
+# Generated by Django 5.2.6 on 2026-10-14 17:47
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastro', '0017_descricaobanco_banco_id_is_ativa_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='descricaobanco',
+            name='cnpj_digits',
+            field=models.GeneratedField(db_persist=True, expression=models.Func(django.db.models.functions.comparison.Coalesce('cnpj', models.Value('')), models.Value('\\D'), models.Value(''), models.Value('g'), function='REGEXP_REPLACE'), output_field=models.CharField(max_length=18)),
+        ),
+        migrations.AddIndex(
+            model_name='contabancaria',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('banco_nome'), name='gin_trgm_ops'), name='conta_banco_nome_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contabancaria',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('agencia'), name='gin_trgm_ops'), name='conta_agencia_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contabancaria',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('conta'), name='gin_trgm_ops'), name='conta_conta_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='descricaobanco',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['cnpj_digits'], name='descbanco_cnpj_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='descricaobanco',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('endereco'), name='gin_trgm_ops'), name='descbanco_end_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='representante',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('cidade'), name='gin_trgm_ops'), name='rep_cidade_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='representante',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('bairro'), name='gin_trgm_ops'), name='rep_bairro_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='representante',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('profissao'), name='gin_trgm_ops'), name='rep_profissao_trgm_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.6 on 2026-10-14 17:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastro', '0018_more_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contabancaria',
+            name='cliente_nome_cache',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='contrato',
+            name='cliente_nome_cache',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='representante',
+            name='cliente_nome_cache',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=200),
+        ),
+        # backfill
+        migrations.RunSQL(
+            sql="UPDATE cadastro_contabancaria AS t SET cliente_nome_cache = c.nome_completo FROM cadastro_cliente AS c WHERE t.cliente_id = c.id",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            sql="UPDATE cadastro_contrato AS t SET cliente_nome_cache = c.nome_completo FROM cadastro_cliente AS c WHERE t.cliente_id = c.id",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            sql="UPDATE cadastro_representante AS t SET cliente_nome_cache = c.nome_completo FROM cadastro_cliente AS c WHERE t.cliente_id = c.id",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.6 on 2026-10-14 17:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastro', '0019_cliente_nome_cache'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                """
+                CREATE MATERIALIZED VIEW mv_descricao_banco_ativa AS
+                SELECT DISTINCT ON (banco_id)
+                       id, banco_id, banco_nome, nome_banco, cnpj, endereco, atualizado_em
+                  FROM cadastro_descricaobanco
+                 WHERE is_ativa
+                 ORDER BY banco_id, atualizado_em DESC, id DESC
+                """,
+                # índice único: exigido pelo REFRESH ... CONCURRENTLY
+                "CREATE UNIQUE INDEX mv_descbanco_ativa_banco_id_uniq ON mv_descricao_banco_ativa (banco_id)",
+                "CREATE INDEX mv_descbanco_ativa_banco_nome_idx ON mv_descricao_banco_ativa (banco_nome)",
+                "CREATE INDEX mv_descbanco_ativa_nome_trgm_idx ON mv_descricao_banco_ativa USING gin (nome_banco gin_trgm_ops)",
+            ],
+            reverse_sql="DROP MATERIALIZED VIEW IF EXISTS mv_descricao_banco_ativa",
+        ),
+        migrations.CreateModel(
+            name='DescricaoBancoAtiva',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('banco_id', models.CharField(max_length=50, unique=True)),
+                ('banco_nome', models.CharField(max_length=255)),
+                ('nome_banco', models.CharField(blank=True, max_length=255, null=True)),
+                ('cnpj', models.CharField(blank=True, max_length=18, null=True)),
+                ('endereco', models.CharField(blank=True, max_length=255, null=True)),
+                ('atualizado_em', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'mv_descricao_banco_ativa',
+                'managed': False,
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-14 17:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastro', '0020_descricaobancoativa_mv'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contabancaria',
+            index=models.Index(condition=models.Q(('is_principal', True)), fields=['cliente'], include=('id', 'banco_nome', 'banco_codigo', 'agencia', 'conta', 'digito', 'tipo'), name='ix_conta_principal_cover'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.6 on 2026-10-14 17:52
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastro', '0021_conta_principal_cover_idx'),
+        ('templates_app', '0002_alter_template_options_template_created_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contrato',
+            name='num_contratos',
+            field=models.GeneratedField(db_persist=True, expression=models.Func('contratos', output_field=models.IntegerField(), template="CASE WHEN jsonb_typeof(%(expressions)s) = 'array' THEN jsonb_array_length(%(expressions)s) ELSE 0 END"), output_field=models.IntegerField()),
+        ),
+        migrations.AddIndex(
+            model_name='contrato',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['contratos'], name='ix_contratos_gin', opclasses=['jsonb_path_ops']),
+        ),
+    ]
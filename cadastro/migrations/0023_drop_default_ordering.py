@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-14 17:54
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastro', '0022_contrato_num_contratos_gin'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='contabancaria',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='contrato',
+            options={'verbose_name': 'Contrato', 'verbose_name_plural': 'Contratos'},
+        ),
+        migrations.AlterModelOptions(
+            name='descricaobanco',
+            options={'verbose_name': 'Descrição de Banco', 'verbose_name_plural': 'Descrições de Bancos'},
+        ),
+        migrations.AlterModelOptions(
+            name='representante',
+            options={},
+        ),
+    ]
@@ -0,0 +1,83 @@
+# Generated by Django 5.2.6 on 2026-10-14 17:55
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+# (tabela, coluna, nº de dígitos, colunas do UNIQUE que a coluna integra)
+DOCUMENTOS = [
+    ("cadastro_cliente", "cpf", 11, ["cpf"]),
+    ("cadastro_representante", "cpf", 11, ["cliente_id", "cpf"]),
+    ("cadastro_contabancariareu", "cnpj", 14, ["cnpj"]),
+]
+
+
+def verifica_documentos(apps, schema_editor):
+    """
+    Antes de remover máscaras e criar os CHECKs: lista os registros que fariam a
+    migração abortar no meio (nº de dígitos errado, ou que sem máscara colidem com
+    outro no UNIQUE), para serem corrigidos à mão antes de rodar de novo.
+    """
+    problemas = []
+    with schema_editor.connection.cursor() as cursor:
+        for tabela, coluna, digitos, unique in DOCUMENTOS:
+            limpo = rf"regexp_replace({coluna}, '\D', '', 'g')"
+            cursor.execute(
+                f"SELECT id FROM {tabela} WHERE length({limpo}) <> %s ORDER BY id", [digitos]
+            )
+            ids = [row[0] for row in cursor.fetchall()]
+            if ids:
+                problemas.append(f"{tabela}.{coluna} sem {digitos} dígitos: ids {ids}")
+
+            chave = ", ".join(limpo if c == coluna else c for c in unique)
+            cursor.execute(
+                f"SELECT array_agg(id ORDER BY id) FROM {tabela} "
+                f"GROUP BY {chave} HAVING count(*) > 1"
+            )
+            for (ids,) in cursor.fetchall():
+                problemas.append(f"{tabela}.{coluna} duplicado sem máscara: ids {ids}")
+
+    if problemas:
+        raise RuntimeError(
+            "Corrija os registros abaixo antes de aplicar esta migração:\n  "
+            + "\n  ".join(problemas)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastro', '0023_drop_default_ordering'),
+    ]
+
+    operations = [
+        migrations.RunPython(verifica_documentos, migrations.RunPython.noop),
+        # registros antigos gravados sem passar por clean(): remove a máscara antes do CHECK
+        migrations.RunSQL(
+            sql=r"UPDATE cadastro_cliente SET cpf = regexp_replace(cpf, '\D', '', 'g') WHERE cpf ~ '\D'",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            sql=r"UPDATE cadastro_representante SET cpf = regexp_replace(cpf, '\D', '', 'g') WHERE cpf ~ '\D'",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            sql=r"UPDATE cadastro_contabancariareu SET cnpj = regexp_replace(cnpj, '\D', '', 'g') WHERE cnpj ~ '\D'",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='representante',
+            index=django.contrib.postgres.indexes.HashIndex(fields=['cpf'], name='rep_cpf_hash_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='cliente',
+            constraint=models.CheckConstraint(condition=models.Q(('cpf__regex', '^[0-9]{11}$')), name='cli_cpf_digits_only'),
+        ),
+        migrations.AddConstraint(
+            model_name='contabancariareu',
+            constraint=models.CheckConstraint(condition=models.Q(('cnpj__regex', '^[0-9]{14}$')), name='reu_cnpj_digits_only'),
+        ),
+        migrations.AddConstraint(
+            model_name='representante',
+            constraint=models.CheckConstraint(condition=models.Q(('cpf__regex', '^[0-9]{11}$')), name='rep_cpf_digits_only'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.6 on 2026-10-14 17:59
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastro', '0025_criado_em_db_default'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cliente',
+            name='search_vec',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector('nome_completo', 'cidade', config='portuguese'), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddField(
+            model_name='representante',
+            name='search_vec',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector('nome_completo', 'cidade', config='portuguese'), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddIndex(
+            model_name='cliente',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vec'], name='ix_cli_search'),
+        ),
+        migrations.AddIndex(
+            model_name='representante',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vec'], name='ix_rep_search'),
+        ),
+    ]
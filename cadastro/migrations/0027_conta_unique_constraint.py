@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-14 18:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastro', '0026_search_vec'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='contabancaria',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='contabancaria',
+            constraint=models.UniqueConstraint(fields=('cliente', 'banco_nome', 'agencia', 'conta', 'digito'), name='unique_conta_por_cliente'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.6 on 2026-10-14 18:18
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastro', '0027_conta_unique_constraint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cliente',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('cpf'), name='gin_trgm_ops'), name='cli_cpf_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cliente',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('bairro'), name='gin_trgm_ops'), name='cli_bairro_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cliente',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('profissao'), name='gin_trgm_ops'), name='cli_profissao_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cliente',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('nacionalidade'), name='gin_trgm_ops'), name='cli_nacionalidade_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cliente',
+            index=models.Index(django.db.models.functions.text.Upper('uf'), name='cli_uf_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contabancaria',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('cliente_nome_cache'), name='gin_trgm_ops'), name='conta_cli_nome_trgm_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-14 18:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastro', '0028_trigram_upper_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='descricaobanco',
+            name='descbanco_bi_ativa_idx',
+        ),
+        migrations.AddIndex(
+            model_name='cliente',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['nome_completo'], name='idx_cliente_active_nome'),
+        ),
+        migrations.AddIndex(
+            model_name='descricaobanco',
+            index=models.Index(fields=['banco_id', 'is_ativa', 'atualizado_em'], name='descbanco_bi_ativa_upd_idx'),
+        ),
+    ]
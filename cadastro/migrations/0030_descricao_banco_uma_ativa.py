@@ -0,0 +1,37 @@
+# Generated by Django 5.2.6 on 2026-10-14 18:29
+
+import django.contrib.postgres.constraints
+import django.db.models.constraints
+from django.conf import settings
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastro', '0029_partial_active_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # EXCLUDE com "=" sobre varchar precisa do btree_gist
+        BtreeGistExtension(),
+        # dados antigos: se um banco_id tiver mais de uma ativa, fica só a mais recente
+        migrations.RunSQL(
+            sql="""
+                UPDATE cadastro_descricaobanco d SET is_ativa = false
+                WHERE d.is_ativa AND EXISTS (
+                    SELECT 1 FROM cadastro_descricaobanco o
+                    WHERE o.banco_id = d.banco_id AND o.is_ativa
+                      AND (o.atualizado_em, o.id) > (d.atualizado_em, d.id)
+                );
+                REFRESH MATERIALIZED VIEW mv_descricao_banco_ativa;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddConstraint(
+            model_name='descricaobanco',
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(condition=models.Q(('is_ativa', True)), deferrable=django.db.models.constraints.Deferrable['DEFERRED'], expressions=[('banco_id', '=')], name='uniq_active_per_banco'),
+        ),
+    ]
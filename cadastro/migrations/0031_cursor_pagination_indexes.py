@@ -0,0 +1,22 @@
+# Generated by Django 5.2.6 on 2026-10-14 18:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastro', '0030_descricao_banco_uma_ativa'),
+        ('templates_app', '0002_alter_template_options_template_created_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cliente',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-criado_em', '-id'], name='idx_cliente_active_criado'),
+        ),
+        migrations.AddIndex(
+            model_name='contrato',
+            index=models.Index(fields=['-criado_em', '-id'], name='contrato_criado_id_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.6 on 2026-10-14 18:34
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY não roda dentro de transação
+    atomic = False
+
+    dependencies = [
+        ('cadastro', '0031_cursor_pagination_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='contabancaria',
+            index=models.Index(fields=['cliente_nome_cache', 'banco_nome'], name='idx_conta_clinome_banco'),
+        ),
+        AddIndexConcurrently(
+            model_name='representante',
+            index=models.Index(fields=['cliente_nome_cache', 'nome_completo'], name='idx_rep_clinome_nome'),
+        ),
+    ]
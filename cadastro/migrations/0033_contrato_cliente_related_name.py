@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-14 19:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastro', '0032_listing_order_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='contrato',
+            name='cliente',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='contratos_cadastro', to='cadastro.cliente'),
+        ),
+    ]
@@ -1,6 +1,16 @@
+from functools import partial
+
 from django.conf import settings
-from django.db import models
-from django.db.models import Q
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import RangeOperators
+from django.contrib.postgres.indexes import GinIndex, HashIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.db import connections, models, transaction
+from django.db.models import Func, Q, Value
+from django.db.models.expressions import DatabaseDefault
+from django.db.models.functions import Coalesce, Now, Upper
+from seal.models import SealableManager, SealableModel
+from seal.query import SealableQuerySet
 
 from .validators import validate_cpf, validate_cnpj, validate_cep, validate_uf, only_digits
 
@@ -15,7 +25,51 @@ ESTADO_CIVIL_CHOICES = [
 ]
 
 
-class Cliente(models.Model):
+class DeferredFieldsManager(SealableManager):
+    """
+    Manager padrão que deixa colunas pesadas fora do SELECT (use .defer(None) p/ trazê-las).
+    Sem JOIN implícito: quem lê dados do cliente faz o select_related (o __str__ usa
+    cliente_nome_cache).
+    """
+
+    def __init__(self, *deferred):
+        super().__init__()
+        self.deferred = deferred
+
+    def get_queryset(self):
+        return super().get_queryset().defer(*self.deferred)
+
+
+class ClienteQuerySet(SealableQuerySet):
+    def with_relations(self):
+        """
+        Pré-carrega contas e representantes em 1 query cada (sem JOIN no cliente):
+        leia obj.contas_list / obj.representantes_list, sem novas consultas.
+        """
+        return self.prefetch_related(
+            models.Prefetch(
+                "contas",
+                queryset=ContaBancaria.objects.only(
+                    "cliente", "cliente_nome_cache", "is_principal", *CONTA_PRINCIPAL_FIELDS
+                ).order_by("-is_principal", "banco_nome", "agencia", "conta"),
+                to_attr="contas_list",
+            ),
+            models.Prefetch(
+                "representantes",
+                queryset=Representante.objects.order_by("nome_completo"),
+                to_attr="representantes_list",
+            ),
+        )
+
+
+class ClienteAtivoManager(models.Manager.from_queryset(ClienteQuerySet)):
+    """Cliente.active: só os ativos (soft delete marca is_active=False)."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_active=True)
+
+
+class Cliente(SealableModel):
     # Identificação
     nome_completo = models.CharField(max_length=200, db_index=True)
     cpf = models.CharField(max_length=11, unique=True, validators=[validate_cpf])
@@ -46,12 +100,45 @@ class Cliente(models.Model):
     # Status (soft delete)
     is_active = models.BooleanField(default=True, db_index=True)
 
+    # Calculado pelo banco: busca textual (FTS) por nome/cidade, indexada (GIN)
+    search_vec = models.GeneratedField(
+        expression=SearchVector("nome_completo", "cidade", config="portuguese"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     # Auditoria
-    criado_em = models.DateTimeField(auto_now_add=True)
+    criado_em = models.DateTimeField(db_default=Now(), editable=False)
     atualizado_em = models.DateTimeField(auto_now=True)
 
+    objects = ClienteQuerySet.as_manager()
+    active = ClienteAtivoManager()
+
     class Meta:
         ordering = ["nome_completo"]
+        indexes = [
+            # pg_trgm: acelera os filtros icontains/SearchFilter. No Postgres o Django gera
+            # UPPER(col::text) LIKE UPPER('%x%'), então o índice é sobre UPPER(col)
+            GinIndex(OpClass(Upper("nome_completo"), name="gin_trgm_ops"), name="cli_nome_trgm_idx"),
+            GinIndex(OpClass(Upper("cidade"), name="gin_trgm_ops"), name="cli_cidade_trgm_idx"),
+            # demais search_fields do ClienteViewSet: o SearchFilter junta tudo com OR,
+            # e basta uma coluna sem índice para o plano virar seq scan
+            GinIndex(OpClass(Upper("cpf"), name="gin_trgm_ops"), name="cli_cpf_trgm_idx"),
+            GinIndex(OpClass(Upper("bairro"), name="gin_trgm_ops"), name="cli_bairro_trgm_idx"),
+            GinIndex(OpClass(Upper("profissao"), name="gin_trgm_ops"), name="cli_profissao_trgm_idx"),
+            GinIndex(OpClass(Upper("nacionalidade"), name="gin_trgm_ops"), name="cli_nacionalidade_trgm_idx"),
+            # filtro uf (iexact → UPPER(uf) = UPPER(%s))
+            models.Index(Upper("uf"), name="cli_uf_upper_idx"),
+            # listagem padrão: só ativos, ordenados por nome (varre só as linhas ativas, já em ordem)
+            models.Index(fields=["nome_completo"], condition=Q(is_active=True), name="idx_cliente_active_nome"),
+            # paginação por cursor dos ativos (ORDER BY criado_em DESC, id DESC)
+            models.Index(fields=["-criado_em", "-id"], condition=Q(is_active=True), name="idx_cliente_active_criado"),
+            GinIndex(fields=["search_vec"], name="ix_cli_search"),
+        ]
+        constraints = [
+            # clean() só roda em forms/serializers; garante no banco que cpf é só dígitos
+            models.CheckConstraint(condition=Q(cpf__regex=r"^[0-9]{11}$"), name="cli_cpf_digits_only"),
+        ]
 
     def clean(self):
         # Normalizações simples
@@ -63,6 +150,47 @@ class Cliente(models.Model):
         return f"{self.nome_completo} ({self.cpf})"
 
 
+class ClienteNomeCacheModel(SealableModel):
+    """
+    Base abstrata para modelos filhos de Cliente que guardam uma cópia
+    (desnormalizada) de cliente.nome_completo: __str__, busca e ordenação
+    por nome do cliente sem JOIN. Mantida no save() do filho e, quando o
+    nome do cliente muda, pelo signal em cadastro/signals.py.
+    """
+    cliente_nome_cache = models.CharField(max_length=200, editable=False, blank=True, db_index=True)
+
+    # cliente_id como lido do banco (None se não lido): save() só relê o nome se mudar
+    _cliente_id_db = None
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._cliente_id_db = instance.__dict__.get("cliente_id")
+        return instance
+
+    def _cliente_mudou(self, update_fields):
+        if update_fields is not None:
+            return not {"cliente", "cliente_id"}.isdisjoint(update_fields)
+        # cliente_id adiado (only/defer) e não atribuído: não mudou
+        return self._state.adding or (
+            "cliente_id" in self.__dict__ and self.cliente_id != self._cliente_id_db
+        )
+
+    def save(self, *args, **kwargs):
+        # nome relido (1 SELECT, se o cliente não estiver em cache) só se o cliente
+        # mudou; renomear o cliente é coberto pelo signal propaga_cliente_nome
+        update_fields = kwargs.get("update_fields")
+        if self._cliente_mudou(update_fields):
+            self.cliente_nome_cache = self.cliente.nome_completo
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "cliente_nome_cache"}
+        super().save(*args, **kwargs)
+        self._cliente_id_db = self.__dict__.get("cliente_id")
+
+
 TIPO_CONTA_CHOICES = [
     ("corrente", "Corrente"),
     ("poupanca", "Poupança"),
@@ -70,7 +198,12 @@ TIPO_CONTA_CHOICES = [
 ]
 
 
-class ContaBancaria(models.Model):
+# Colunas lidas na geração de documentos a partir da conta principal;
+# cobertas pelo índice ix_conta_principal_cover (index-only scan).
+CONTA_PRINCIPAL_FIELDS = ("id", "banco_nome", "banco_codigo", "agencia", "conta", "digito", "tipo")
+
+
+class ContaBancaria(ClienteNomeCacheModel):
     cliente = models.ForeignKey(Cliente, on_delete=models.CASCADE, related_name="contas")
     banco_nome = models.CharField(max_length=100)               # Ex.: "Banco do Brasil"
     banco_codigo = models.CharField(max_length=5, blank=True)   # Ex.: "001" (COMPE/ISPB curta)
@@ -80,30 +213,56 @@ class ContaBancaria(models.Model):
     tipo = models.CharField(max_length=10, choices=TIPO_CONTA_CHOICES, default="corrente")
     is_principal = models.BooleanField(default=False)
 
-    criado_em = models.DateTimeField(auto_now_add=True)
+    criado_em = models.DateTimeField(db_default=Now(), editable=False)
     atualizado_em = models.DateTimeField(auto_now=True)
 
+    objects = SealableManager()
+
+    @classmethod
+    def principal_de(cls, cliente):
+        """Conta principal do cliente (só as colunas cobertas pelo índice) ou None."""
+        return (
+            cls.objects.only("cliente", *CONTA_PRINCIPAL_FIELDS)
+            .filter(cliente=cliente, is_principal=True)
+            .order_by()
+            .first()
+        )
+
     class Meta:
-        unique_together = [("cliente", "banco_nome", "agencia", "conta", "digito")]
-        ordering = ["cliente", "banco_nome", "agencia", "conta"]
         constraints = [
+            models.UniqueConstraint(
+                fields=["cliente", "banco_nome", "agencia", "conta", "digito"],
+                name="unique_conta_por_cliente",
+            ),
             models.UniqueConstraint(
                 fields=["cliente"],
                 condition=Q(is_principal=True),
                 name="unique_principal_per_cliente",
-            )
+            ),
+        ]
+        indexes = [
+            # pg_trgm: filtros *_icontains e SearchFilter (UPPER(col) LIKE '%X%')
+            GinIndex(OpClass(Upper("banco_nome"), name="gin_trgm_ops"), name="conta_banco_nome_trgm_idx"),
+            GinIndex(OpClass(Upper("agencia"), name="gin_trgm_ops"), name="conta_agencia_trgm_idx"),
+            GinIndex(OpClass(Upper("conta"), name="gin_trgm_ops"), name="conta_conta_trgm_idx"),
+            GinIndex(OpClass(Upper("cliente_nome_cache"), name="gin_trgm_ops"), name="conta_cli_nome_trgm_idx"),
+            # ordenação padrão da listagem (sem JOIN no cliente): vira index scan, sem Sort
+            models.Index(fields=["cliente_nome_cache", "banco_nome"], name="idx_conta_clinome_banco"),
+            # conta principal do cliente (geração de documentos)
+            models.Index(
+                fields=["cliente"],
+                condition=Q(is_principal=True),
+                include=CONTA_PRINCIPAL_FIELDS,
+                name="ix_conta_principal_cover",
+            ),
         ]
 
     def __str__(self):
         dd = f"-{self.digito}" if self.digito else ""
-        return f"{self.cliente.nome_completo} | {self.banco_nome} ag {self.agencia} conta {self.conta}{dd}"
-
+        return f"{self.cliente_nome_cache} | {self.banco_nome} ag {self.agencia} conta {self.conta}{dd}"
 
-# cadastro/models.py
-from django.db import models
-from django.conf import settings
 
-class DescricaoBanco(models.Model):
+class DescricaoBanco(SealableModel):
     banco_id = models.CharField(max_length=50)
     banco_nome = models.CharField(max_length=255)
 
@@ -112,9 +271,29 @@ class DescricaoBanco(models.Model):
     cnpj = models.CharField(max_length=18, null=True, blank=True)
     endereco = models.CharField(max_length=255, null=True, blank=True)
 
+    # CNPJ só com dígitos (calculado pelo banco), para busca parcial indexada
+    cnpj_digits = models.GeneratedField(
+        expression=Func(Coalesce("cnpj", Value("")), Value(r"\D"), Value(""), Value("g"), function="REGEXP_REPLACE"),
+        output_field=models.CharField(max_length=18),
+        db_persist=True,
+    )
+
     is_ativa = models.BooleanField(default=False)
 
-    criado_em = models.DateTimeField(auto_now_add=True)
+    # Calculado pelo banco: True se algum dos campos estruturados estiver preenchido
+    # (usado pelo filtro has_dados sem varrer as três colunas de texto)
+    has_dados = models.GeneratedField(
+        expression=(
+            (Q(nome_banco__isnull=False) & ~Q(nome_banco=""))
+            | (Q(cnpj__isnull=False) & ~Q(cnpj=""))
+            | (Q(endereco__isnull=False) & ~Q(endereco=""))
+        ),
+        output_field=models.BooleanField(),
+        db_persist=True,
+        db_index=True,
+    )
+
+    criado_em = models.DateTimeField(db_default=Now(), editable=False)
     atualizado_em = models.DateTimeField(auto_now=True)
     atualizado_por = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -127,16 +306,192 @@ class DescricaoBanco(models.Model):
     class Meta:
         verbose_name = "Descrição de Banco"
         verbose_name_plural = "Descrições de Bancos"
-        ordering = ["banco_nome", "-is_ativa", "-atualizado_em"]
+        constraints = [
+            # no máximo 1 ativa por banco_id. Verificada só no COMMIT (DEFERRED): as trocas
+            # de ativa (CTE, admin, lote) passam por um instante com 2 ativas
+            ExclusionConstraint(
+                name="uniq_active_per_banco",
+                expressions=[("banco_id", RangeOperators.EQUAL)],
+                condition=Q(is_ativa=True),
+                deferrable=models.Deferrable.DEFERRED,
+            ),
+        ]
+        indexes = [
+            # desativação "ativa por banco": filter(banco_id=..., is_ativa=True); e o lookup
+            # (ativa ou, sem ativa, a mais recente): lido de trás p/ frente já sai na ordem
+            # de order_by("-is_ativa", "-atualizado_em"), e o LIMIT 1 para na 1ª entrada
+            models.Index(fields=["banco_id", "is_ativa", "atualizado_em"], name="descbanco_bi_ativa_upd_idx"),
+            # pg_trgm: *_icontains sobre UPPER(col); cnpj_digits é buscado com contains (LIKE puro)
+            GinIndex(OpClass(Upper("nome_banco"), name="gin_trgm_ops"), name="descbanco_nome_trgm_idx"),
+            GinIndex(fields=["cnpj_digits"], opclasses=["gin_trgm_ops"], name="descbanco_cnpj_trgm_idx"),
+            GinIndex(OpClass(Upper("endereco"), name="gin_trgm_ops"), name="descbanco_end_trgm_idx"),
+        ]
 
     def __str__(self):
         return f"{self.banco_nome} - {self.nome_banco} ({'ATIVA' if self.is_ativa else 'Inativa'})"
 
+    @classmethod
+    def create_and_activate(cls, using="default", **values):
+        """
+        Cria uma descrição já ATIVA e desativa as demais do mesmo banco_id numa
+        única instrução (CTE: UPDATE + INSERT ... RETURNING), 1 ida ao banco.
+        Como não passa por save(), agenda o refresh da view de ativas no commit.
+        """
+        obj = cls(**values, is_ativa=True)
+        connection = connections[using]
+        qn = connection.ops.quote_name
+
+        columns, params = obj._db_write_values(connection, add=True)
+        returned = cls._meta.concrete_fields
+        table = qn(cls._meta.db_table)
+        sql = (
+            f"WITH deact AS ("
+            f"UPDATE {table} SET {qn('is_ativa')} = false "
+            f"WHERE {qn('banco_id')} = %s AND {qn('is_ativa')}) "
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))}) "
+            f"RETURNING {', '.join(qn(f.column) for f in returned)}"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [obj.banco_id, *params])
+            row = cursor.fetchone()
+
+        schedule_refresh_descricao_banco_ativa(using)
+        return cls.from_db(using, [f.attname for f in returned], row)
+
+    def save_and_activate(self, using="default"):
+        """
+        Grava esta descrição (já existente) como ATIVA e desativa as demais do mesmo
+        banco_id numa única instrução (CTE: UPDATE das outras + UPDATE desta).
+        Como não passa por save(), agenda o refresh da view de ativas no commit.
+        """
+        self.is_ativa = True
+        connection = connections[using]
+        qn = connection.ops.quote_name
+
+        columns, params = self._db_write_values(connection, add=False)
+        returned = [f for f in self._meta.concrete_fields if f.generated]
+        table = qn(self._meta.db_table)
+        pk = qn(self._meta.pk.column)
+        sql = (
+            f"WITH deact AS ("
+            f"UPDATE {table} SET {qn('is_ativa')} = false "
+            f"WHERE {qn('banco_id')} = %s AND {qn('is_ativa')} AND {pk} <> %s) "
+            f"UPDATE {table} SET {', '.join(f'{c} = %s' for c in columns)} WHERE {pk} = %s "
+            f"RETURNING {', '.join(qn(f.column) for f in returned)}"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [self.banco_id, self.pk, *params, self.pk])
+            row = cursor.fetchone()
+
+        # colunas calculadas pelo banco (cnpj_digits, has_dados) voltam no RETURNING
+        for field, value in zip(returned, row):
+            setattr(self, field.attname, value)
+        schedule_refresh_descricao_banco_ativa(using)
+
+    def _db_write_values(self, connection, *, add):
+        """(colunas, parâmetros) que o save() gravaria, para os INSERT/UPDATE manuais acima."""
+        qn = connection.ops.quote_name
+        deferred = self.get_deferred_fields()
+        columns, params = [], []
+        for field in self._meta.concrete_fields:
+            if field.primary_key or field.generated or field.attname in deferred:
+                continue
+            value = field.pre_save(self, add=add)
+            if isinstance(value, DatabaseDefault):
+                continue  # ex.: criado_em (DEFAULT now())
+            columns.append(qn(field.column))
+            params.append(field.get_db_prep_save(value, connection))
+        return columns, params
+
+    @classmethod
+    def bulk_create_with_activation(cls, objs, using="default"):
+        """
+        Grava várias descrições com um bulk_create. As atuais dos banco_id marcados
+        como ativos no lote são desativadas num único UPDATE; dentro do lote vale
+        a última ativa de cada banco_id. bulk_create não dispara post_save, então
+        o refresh da view de ativas é agendado no commit.
+        """
+        ultima_ativa = {obj.banco_id: obj for obj in objs if obj.is_ativa and obj.banco_id}
+        for obj in objs:
+            if obj.is_ativa and obj.banco_id and ultima_ativa[obj.banco_id] is not obj:
+                obj.is_ativa = False
+
+        with transaction.atomic(using=using):
+            if ultima_ativa:
+                cls.objects.using(using).filter(
+                    banco_id__in=ultima_ativa, is_ativa=True
+                ).update(is_ativa=False)
+            objs = cls.objects.using(using).bulk_create(objs)
+            schedule_refresh_descricao_banco_ativa(using)
+        return objs
+
+
+class DescricaoBancoAtiva(models.Model):
+    """
+    Somente leitura: materialized view 'mv_descricao_banco_ativa', com a
+    descrição ATIVA mais recente de cada banco_id (colunas já projetadas).
+    Atualizada por refresh_descricao_banco_ativa() após gravações em DescricaoBanco.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    banco_id = models.CharField(max_length=50, unique=True)
+    banco_nome = models.CharField(max_length=255)
+    nome_banco = models.CharField(max_length=255, null=True, blank=True)
+    cnpj = models.CharField(max_length=18, null=True, blank=True)
+    endereco = models.CharField(max_length=255, null=True, blank=True)
+    atualizado_em = models.DateTimeField()
+
+    class Meta:
+        managed = False
+        db_table = "mv_descricao_banco_ativa"
+
+    def __str__(self):
+        return f"{self.banco_nome} - {self.nome_banco} (ATIVA)"
+
+
+def refresh_descricao_banco_ativa(using="default"):
+    """Recalcula a materialized view das descrições ativas (sem bloquear leituras)."""
+    with connections[using].cursor() as cursor:
+        cursor.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_descricao_banco_ativa")
+
+
+def schedule_refresh_descricao_banco_ativa(using="default"):
+    """
+    Agenda o refresh da view para o commit da transação corrente — no máximo 1 por
+    transação, por mais descrições que ela grave. O "já agendado" é procurado na
+    fila de on_commit da conexão (e não numa flag), pois a fila some com o rollback.
+    """
+    pendentes = connections[using].run_on_commit
+    if any(getattr(item[1], "func", None) is refresh_descricao_banco_ativa for item in pendentes):
+        return
+    transaction.on_commit(partial(refresh_descricao_banco_ativa, using), using=using)
+
+
+def get_descricao_banco_ativa(banco_id="", banco_nome=""):
+    """
+    Descrição ativa (dict com banco_nome, nome_banco, cnpj, endereco) por banco_id,
+    ou por banco_nome se não houver id. None quando não existe.
+    Lê direto da view (banco_id e banco_nome indexados): sem cache de processo, que
+    ficaria defasado entre os workers do gunicorn.
+    """
+    if banco_id:
+        lookup = {"banco_id": banco_id}
+    elif banco_nome:
+        lookup = {"banco_nome": banco_nome}
+    else:
+        lookup = {}
+
+    return (
+        DescricaoBancoAtiva.objects.filter(**lookup)
+        .order_by("-atualizado_em")
+        .values("banco_nome", "nome_banco", "cnpj", "endereco")
+        .first()
+    )
+
 
 # --------------------------------------------------------------------
 # Representantes do Cliente
 # --------------------------------------------------------------------
-class Representante(models.Model):
+class Representante(ClienteNomeCacheModel):
     """
     Pessoa que representa o Cliente (pode haver vários).
     - Se 'usa_endereco_do_cliente' for True, o front pode copiar os campos de endereço do Cliente.
@@ -170,21 +525,40 @@ class Representante(models.Model):
     cep = models.CharField(max_length=8, blank=True, validators=[validate_cep])
     uf = models.CharField(max_length=2, blank=True, validators=[validate_uf])
 
+    # Calculado pelo banco: busca textual (FTS) por nome/cidade, indexada (GIN)
+    search_vec = models.GeneratedField(
+        expression=SearchVector("nome_completo", "cidade", config="portuguese"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     # Auditoria
-    criado_em = models.DateTimeField(auto_now_add=True)
+    criado_em = models.DateTimeField(db_default=Now(), editable=False)
     atualizado_em = models.DateTimeField(auto_now=True)
 
+    objects = SealableManager()
+
     class Meta:
-        ordering = ["cliente", "nome_completo"]
         constraints = [
             # Evita duplicar o mesmo CPF para o mesmo cliente (mas permite o mesmo CPF representar clientes diferentes)
             models.UniqueConstraint(
                 fields=["cliente", "cpf"],
                 name="unique_representante_por_cliente",
             ),
+            models.CheckConstraint(condition=Q(cpf__regex=r"^[0-9]{11}$"), name="rep_cpf_digits_only"),
         ]
         indexes = [
             models.Index(fields=["cliente", "nome_completo"]),
+            # ordenação padrão da listagem (sem JOIN no cliente): vira index scan, sem Sort
+            models.Index(fields=["cliente_nome_cache", "nome_completo"], name="idx_rep_clinome_nome"),
+            # filter_cpf busca só por cpf (o índice único começa por cliente)
+            HashIndex(fields=["cpf"], name="rep_cpf_hash_idx"),
+            # pg_trgm: *_icontains (UPPER(col) LIKE '%X%')
+            GinIndex(OpClass(Upper("nome_completo"), name="gin_trgm_ops"), name="rep_nome_trgm_idx"),
+            GinIndex(OpClass(Upper("cidade"), name="gin_trgm_ops"), name="rep_cidade_trgm_idx"),
+            GinIndex(OpClass(Upper("bairro"), name="gin_trgm_ops"), name="rep_bairro_trgm_idx"),
+            GinIndex(OpClass(Upper("profissao"), name="gin_trgm_ops"), name="rep_profissao_trgm_idx"),
+            GinIndex(fields=["search_vec"], name="ix_rep_search"),
         ]
 
     def clean(self):
@@ -193,7 +567,7 @@ class Representante(models.Model):
         self.uf = (self.uf or "").upper()
 
     def __str__(self):
-        return f"{self.nome_completo} (rep. de {self.cliente.nome_completo})"
+        return f"{self.nome_completo} (rep. de {self.cliente_nome_cache})"
 
 
 # --------------------------------------------------------------------
@@ -218,13 +592,16 @@ class ContaBancariaReu(models.Model):
     estado = models.CharField(max_length=2, blank=True, validators=[validate_uf])  # UF do estado
     cep = models.CharField(max_length=8, blank=True, validators=[validate_cep])
 
-    criado_em = models.DateTimeField(auto_now_add=True)
+    criado_em = models.DateTimeField(db_default=Now(), editable=False)
     atualizado_em = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "Banco do Réu"
         verbose_name_plural = "Bancos dos Réus"
         ordering = ["banco_nome"]
+        constraints = [
+            models.CheckConstraint(condition=Q(cnpj__regex=r"^[0-9]{14}$"), name="reu_cnpj_digits_only"),
+        ]
 
     def clean(self):
         self.cnpj = only_digits(self.cnpj)
@@ -238,7 +615,7 @@ class ContaBancariaReu(models.Model):
 # --------------------------------------------------------------------
 # Contratos
 # --------------------------------------------------------------------
-class Contrato(models.Model):
+class Contrato(ClienteNomeCacheModel):
     """
     Contrato vinculado a um Cliente e Template.
     - O campo 'contratos' armazena um array JSONB com os dados de cada contrato.
@@ -260,7 +637,8 @@ class Contrato(models.Model):
     cliente = models.ForeignKey(
         Cliente,
         on_delete=models.PROTECT,  # Não permite deletar cliente se tiver contratos
-        related_name="contratos"
+        # "contratos" fica com contracts.Contrato (mesmo reverse em Cliente: E304/E305)
+        related_name="contratos_cadastro"
     )
     template = models.ForeignKey(
         "templates_app.Template",  # Importação lazy para evitar dependência circular
@@ -272,6 +650,19 @@ class Contrato(models.Model):
         blank=True,
         help_text="Array JSONB com os dados de cada contrato"
     )
+    # Calculado pelo banco: tamanho do array 'contratos' (0 se não for array)
+    num_contratos = models.GeneratedField(
+        expression=Func(
+            "contratos",
+            template=(
+                "CASE WHEN jsonb_typeof(%(expressions)s) = 'array' "
+                "THEN jsonb_array_length(%(expressions)s) ELSE 0 END"
+            ),
+            output_field=models.IntegerField(),
+        ),
+        output_field=models.IntegerField(),
+        db_persist=True,
+    )
     verifica_documento = models.JSONField(
         default=dict,
         blank=True,
@@ -286,14 +677,26 @@ class Contrato(models.Model):
     )
 
     # Auditoria
-    criado_em = models.DateTimeField(auto_now_add=True)
+    criado_em = models.DateTimeField(db_default=Now(), editable=False)
     atualizado_em = models.DateTimeField(auto_now=True)
 
+    # imagem (path) e JSON do formulário de verificação só interessam ao CRUD/detalhe
+    objects = DeferredFieldsManager("imagem_do_contrato", "verifica_documento")
+
     class Meta:
         verbose_name = "Contrato"
         verbose_name_plural = "Contratos"
-        ordering = ["-criado_em"]
+        indexes = [
+            # consultas de contenção (contratos__contains=[{"banco_do_contrato": ...}])
+            GinIndex(fields=["contratos"], opclasses=["jsonb_path_ops"], name="ix_contratos_gin"),
+            # listagem/cursor: ORDER BY criado_em DESC, id DESC
+            models.Index(fields=["-criado_em", "-id"], name="contrato_criado_id_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # valor calculado pelo banco: descarta o antigo p/ recarregar sob demanda
+        self.__dict__.pop("num_contratos", None)
 
     def __str__(self):
-        num_contratos = len(self.contratos) if isinstance(self.contratos, list) else 0
-        return f"Contrato #{self.id} - {self.cliente.nome_completo} ({num_contratos} contrato(s))"
+        return f"Contrato #{self.id} - {self.cliente_nome_cache} ({self.num_contratos} contrato(s))"
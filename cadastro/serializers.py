@@ -1,15 +1,51 @@
-from django.db import transaction
+from contextlib import contextmanager
+from functools import cached_property
+
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
+from common.serializers import CachedFieldsModelSerializer, EagerLoadingMixin, FastListSerializer
 from .models import Cliente, ContaBancaria, ContaBancariaReu, DescricaoBanco, Representante, Contrato
 from .validators import only_digits, validate_cpf, validate_cnpj, validate_cep, validate_uf, validate_banco_id
 
 
+class _UserContextMixin:
+    """
+    Resolve o usuário autenticado da requisição uma única vez por serializer
+    (no lote/listagem, o serializer filho é o mesmo para todas as linhas).
+    """
+
+    @cached_property
+    def _cached_user(self):
+        request = self.context.get("request")
+        user = getattr(request, "user", None)
+        return user if getattr(user, "is_authenticated", False) else None
+
+
+@contextmanager
+def _unique_violation_as(errors_by_constraint):
+    """
+    Traduz a violação de uma constraint única do banco em ValidationError (400),
+    conforme o mapa {nome_da_constraint: erros}.
+    A unicidade fica a cargo do banco (sem SELECT prévio, sem corrida); o bloco
+    roda em savepoint para não quebrar a transação externa.
+    """
+    try:
+        with transaction.atomic():
+            yield
+    except IntegrityError as exc:
+        diag = getattr(exc.__cause__, "diag", None)
+        errors = errors_by_constraint.get(getattr(diag, "constraint_name", None))
+        if errors is not None:
+            raise ValidationError(errors) from exc
+        raise
+
+
 # =========================
 # Cliente
 # =========================
-class ClienteSerializer(serializers.ModelSerializer):
+class ClienteSerializer(CachedFieldsModelSerializer):
     class Meta:
         model = Cliente
         fields = [
@@ -41,6 +77,7 @@ class ClienteSerializer(serializers.ModelSerializer):
             "criado_em",
             "atualizado_em",
         ]
+        list_serializer_class = FastListSerializer
         read_only_fields = ["criado_em", "atualizado_em"]
         extra_kwargs = {
             "cpf": {"validators": []}  # Remove validadores padrão de unicidade
@@ -59,10 +96,7 @@ class ClienteSerializer(serializers.ModelSerializer):
         return v
 
     def validate_uf(self, v):
-        v = (v or "").upper()
-        if v:
-            validate_uf(v)
-        return v
+        return validate_uf(v) if v else ""
 
     def validate(self, attrs):
         """
@@ -71,11 +105,11 @@ class ClienteSerializer(serializers.ModelSerializer):
         """
         # Só valida se estamos criando (não editando)
         if not self.instance:
+            # attrs["cpf"] já vem normalizado por validate_cpf
             cpf = attrs.get("cpf")
             if cpf:
-                cpf_normalizado = only_digits(cpf)
                 # Verifica se já existe cliente com este CPF
-                cliente_existente = Cliente.objects.filter(cpf=cpf_normalizado).first()
+                cliente_existente = Cliente.objects.filter(cpf=cpf).first()
                 if cliente_existente:
                     if cliente_existente.is_active:
                         # Se está ativo, não permite duplicar
@@ -83,6 +117,8 @@ class ClienteSerializer(serializers.ModelSerializer):
                             {"cpf": ["Já existe um cliente ativo com este CPF."]}
                         )
                     # Se está inativo, não levanta erro aqui (será tratado no create)
+                # guarda o resultado da busca para o create() não repetir a query
+                self._cliente_existente = (cpf, cliente_existente)
         return attrs
 
     def create(self, validated_data):
@@ -94,11 +130,13 @@ class ClienteSerializer(serializers.ModelSerializer):
         (retorna como se fosse um novo cadastro, sem indicar que já existia)
         """
         cpf = validated_data.get("cpf")
-        cpf_normalizado = only_digits(cpf) if cpf else None
 
-        if cpf_normalizado:
-            # Busca cliente existente com este CPF (ativo ou inativo)
-            cliente_existente = Cliente.objects.filter(cpf=cpf_normalizado).first()
+        if cpf:
+            # Busca cliente existente com este CPF (ativo ou inativo);
+            # reaproveita a busca feita em validate() quando for o mesmo CPF
+            cached_cpf, cliente_existente = getattr(self, "_cliente_existente", (None, None))
+            if cached_cpf != cpf:
+                cliente_existente = Cliente.objects.filter(cpf=cpf).first()
 
             if cliente_existente:
                 if cliente_existente.is_active:
@@ -113,17 +151,21 @@ class ClienteSerializer(serializers.ModelSerializer):
                     validated_data.pop("criado_em", None)
                     validated_data.pop("atualizado_em", None)
                     
-                    # Atualiza o cliente existente com os novos dados
+                    # Atualiza o cliente existente só nos campos que mudaram
+                    changed = []
                     for attr, value in validated_data.items():
                         if hasattr(cliente_existente, attr) and attr not in ["id", "criado_em", "atualizado_em"]:
-                            setattr(cliente_existente, attr, value)
+                            if getattr(cliente_existente, attr) != value:
+                                setattr(cliente_existente, attr, value)
+                                changed.append(attr)
                     
                     # Ativa o cliente
                     cliente_existente.is_active = True
+                    changed += ["is_active", "atualizado_em"]
                     
-                    # Salva o cliente (update_fields não é necessário aqui pois estamos atualizando o mesmo registro)
+                    # Grava apenas as colunas alteradas (+ auto_now de atualizado_em)
                     # O Django não valida unicidade do CPF ao atualizar o mesmo registro
-                    cliente_existente.save()
+                    cliente_existente.save(update_fields=changed)
                     
                     # Retorna o cliente restaurado (como se fosse um novo cadastro)
                     return cliente_existente
@@ -135,7 +177,41 @@ class ClienteSerializer(serializers.ModelSerializer):
 # =========================
 # Conta Bancária
 # =========================
-class ContaBancariaSerializer(serializers.ModelSerializer):
+class ContaBancariaListSerializer(FastListSerializer):
+    """
+    Criação em lote de contas: um bulk_create para as contas e outro para as
+    variações de DescricaoBanco pedidas no lote (ver bulk_create_with_activation).
+    """
+
+    @transaction.atomic
+    def create(self, validated_data):
+        child = self.child
+        contas, descricoes = [], []
+        for data in validated_data:
+            # retira campos write-only antes do create
+            banco_id = data.pop("banco_id", None)
+            descricao_banco = data.pop("descricao_banco", None)
+            descricao_set_ativa = bool(data.pop("descricao_set_ativa", False))
+
+            conta = ContaBancaria(**data)
+            # bulk_create não passa por save(): preenche o cache do nome aqui
+            conta.cliente_nome_cache = conta.cliente.nome_completo
+            contas.append(conta)
+
+            values = child._descricao_banco_values(
+                banco_id=banco_id, banco_nome=conta.banco_nome, descricao=descricao_banco
+            )
+            if values is not None:
+                descricoes.append(DescricaoBanco(**values, is_ativa=descricao_set_ativa))
+
+        with _unique_violation_as(child.UNIQUE_VIOLATIONS):
+            contas = ContaBancaria.objects.bulk_create(contas)
+        if descricoes:
+            DescricaoBanco.bulk_create_with_activation(descricoes)
+        return contas
+
+
+class ContaBancariaSerializer(_UserContextMixin, CachedFieldsModelSerializer):
     # ---- Campos opcionais (write-only) para a funcionalidade de descrições por banco) ----
     # Se enviados, o backend cria uma NOVA variação de descrição para o banco
     # e, se 'descricao_set_ativa' = True, a marca como ATIVA (desativando as demais do mesmo banco_id).
@@ -162,7 +238,12 @@ class ContaBancariaSerializer(serializers.ModelSerializer):
             "descricao_banco",
             "descricao_set_ativa",
         ]
+        list_serializer_class = ContaBancariaListSerializer
         read_only_fields = ["criado_em", "atualizado_em"]
+        # Unicidade (cliente, banco_nome, agencia, conta, digito): a cargo da
+        # constraint unique_conta_por_cliente; digito segue obrigatório como antes
+        validators = []
+        extra_kwargs = {"digito": {"required": True}}
 
     # Normalizações
     def validate_agencia(self, v):
@@ -174,43 +255,59 @@ class ContaBancariaSerializer(serializers.ModelSerializer):
     def validate_digito(self, v):
         return only_digits(v)
 
+    PRINCIPAL_DUPLICADA = {"is_principal": ["Este cliente já possui uma conta principal."]}
+    CONTA_DUPLICADA = {
+        "non_field_errors": ["Os campos cliente, banco_nome, agencia, conta, digito devem criar um set único."]
+    }
+    UNIQUE_VIOLATIONS = {
+        "unique_principal_per_cliente": PRINCIPAL_DUPLICADA,
+        "unique_conta_por_cliente": CONTA_DUPLICADA,
+    }
+
     def validate(self, attrs):
-        # mantém sua regra: apenas uma principal por cliente
-        is_principal = attrs.get("is_principal", False)
-        cliente = attrs.get("cliente") or getattr(getattr(self, "instance", None), "cliente", None)
-        if is_principal and cliente:
-            qs = ContaBancaria.objects.filter(cliente=cliente, is_principal=True)
-            if self.instance:
-                qs = qs.exclude(pk=self.instance.pk)
-            if qs.exists():
-                raise serializers.ValidationError("Este cliente já possui uma conta principal.")
+        # regra "apenas uma principal por cliente": garantida pela constraint
+        # unique_principal_per_cliente (ver create/update). Na criação em lote,
+        # a view pré-carrega quem já tem principal e o lote é checado em memória.
+        com_principal = self.context.get("clientes_com_principal")
+        if com_principal is None or not attrs.get("is_principal", False):
+            return attrs
+        # o cliente (e o FK da instância) só é resolvido quando a checagem em lote precisa
+        cliente = attrs.get("cliente")
+        if cliente is None and self.instance is not None:
+            cliente = self.instance.cliente
+        if cliente:
+            if cliente.pk in com_principal:
+                raise serializers.ValidationError(self.PRINCIPAL_DUPLICADA)
+            com_principal.add(cliente.pk)
         return attrs
 
     # --------- hooks para criação de uma nova variação de DescricaoBanco (opcional) ---------
-    def _maybe_create_descricao_banco(
-        self, *, banco_id: str | None, banco_nome: str, descricao: str | None, set_ativa: bool
-    ):
+    def _descricao_banco_values(self, *, banco_id: str | None, banco_nome: str, descricao: str | None):
+        """Campos da nova variação de DescricaoBanco, ou None se não veio info suficiente."""
         banco_id = (banco_id or "").strip()
         descricao = (descricao or "").strip()
         if not banco_id or descricao == "":
             # nada a fazer; recurso é opcional
-            return
+            return None
 
-        req = self.context.get("request") if hasattr(self, "context") else None
-        user = getattr(req, "user", None) if req else None
+        return dict(
+            banco_id=banco_id,
+            banco_nome=banco_nome,
+            # o antigo texto livre 'descricao' vira o nome personalizado do banco
+            nome_banco=descricao,
+            atualizado_por=self._cached_user,
+        )
 
-        with transaction.atomic():
-            if set_ativa:
-                # Desativa outras ativas do mesmo banco_id
-                DescricaoBanco.objects.filter(banco_id=banco_id, is_ativa=True).update(is_ativa=False)
-            obj = DescricaoBanco.objects.create(
-                banco_id=banco_id,
-                banco_nome=banco_nome,
-                descricao=descricao,
-                is_ativa=bool(set_ativa),
-                atualizado_por=user if (user and getattr(user, "is_authenticated", False)) else None,
-            )
-            return obj
+    def _maybe_create_descricao_banco(
+        self, *, banco_id: str | None, banco_nome: str, descricao: str | None, set_ativa: bool
+    ):
+        values = self._descricao_banco_values(banco_id=banco_id, banco_nome=banco_nome, descricao=descricao)
+        if values is None:
+            return
+        if set_ativa:
+            # desativa as outras ativas do mesmo banco_id e cria esta, numa só instrução
+            return DescricaoBanco.create_and_activate(**values)
+        return DescricaoBanco.objects.create(**values, is_ativa=False)
 
     def create(self, validated_data):
         # retira campos write-only antes do create
@@ -218,7 +315,8 @@ class ContaBancariaSerializer(serializers.ModelSerializer):
         descricao_banco = validated_data.pop("descricao_banco", None)
         descricao_set_ativa = bool(validated_data.pop("descricao_set_ativa", False))
 
-        obj = super().create(validated_data)
+        with _unique_violation_as(self.UNIQUE_VIOLATIONS):
+            obj = super().create(validated_data)
 
         # cria uma NOVA variação de descrição (se veio info suficiente)
         self._maybe_create_descricao_banco(
@@ -235,7 +333,8 @@ class ContaBancariaSerializer(serializers.ModelSerializer):
         descricao_banco = validated_data.pop("descricao_banco", None)
         descricao_set_ativa = bool(validated_data.pop("descricao_set_ativa", False))
 
-        obj = super().update(instance, validated_data)
+        with _unique_violation_as(self.UNIQUE_VIOLATIONS):
+            obj = super().update(instance, validated_data)
 
         # cria uma NOVA variação de descrição (se veio info suficiente)
         self._maybe_create_descricao_banco(
@@ -252,7 +351,19 @@ class ContaBancariaSerializer(serializers.ModelSerializer):
 # =========================
 # cadastro/serializers.py
 
-class DescricaoBancoSerializer(serializers.ModelSerializer):
+class DescricaoBancoListSerializer(serializers.ListSerializer):
+    """
+    Criação em lote de descrições: em vez de UPDATE + INSERT por linha, desativa
+    as atuais de todos os bancos do lote num único UPDATE e grava com bulk_create.
+    """
+
+    def create(self, validated_data):
+        user = self.child._cached_user
+        objs = [DescricaoBanco(**data, atualizado_por=user) for data in validated_data]
+        return DescricaoBanco.bulk_create_with_activation(objs)
+
+
+class DescricaoBancoSerializer(_UserContextMixin, CachedFieldsModelSerializer):
     """
     Serializer do recurso 'descrição por banco' com suporte a múltiplas variações.
     Agora usa campos estruturados (nome_banco, cnpj, endereco).
@@ -272,6 +383,7 @@ class DescricaoBancoSerializer(serializers.ModelSerializer):
             "atualizado_em",
         ]
         read_only_fields = ["criado_em", "atualizado_em"]
+        list_serializer_class = DescricaoBancoListSerializer
 
     # --- Validadores individuais ---
     def validate_banco_id(self, v: str) -> str:
@@ -281,32 +393,34 @@ class DescricaoBancoSerializer(serializers.ModelSerializer):
         return (v or "").strip()
 
     # --- Criação com controle de "is_ativa" ---
-    @transaction.atomic
     def create(self, validated_data):
+        validated_data["atualizado_por"] = self._cached_user
         set_ativa = bool(validated_data.get("is_ativa", False))
         banco_id = validated_data.get("banco_id")
 
         # Se marcamos esta como ativa, desativa as demais do mesmo banco
+        # e cria o novo registro numa única instrução
         if set_ativa and banco_id:
-            DescricaoBanco.objects.filter(
-                banco_id=banco_id, is_ativa=True
-            ).update(is_ativa=False)
+            values = {k: v for k, v in validated_data.items() if k != "is_ativa"}
+            return DescricaoBanco.create_and_activate(**values)
 
         # Cria o novo registro normalmente
         obj = super().create(validated_data)
         return obj
 
     # --- Atualização com controle de "is_ativa" ---
-    @transaction.atomic
     def update(self, instance, validated_data):
+        validated_data["atualizado_por"] = self._cached_user
         set_ativa = bool(validated_data.get("is_ativa", instance.is_ativa))
         banco_id = validated_data.get("banco_id", instance.banco_id)
 
         # Se esta variação for marcada como ativa, desativa as demais
+        # e grava esta numa única instrução
         if set_ativa and banco_id:
-            DescricaoBanco.objects.filter(
-                banco_id=banco_id, is_ativa=True
-            ).exclude(pk=instance.pk).update(is_ativa=False)
+            for attr, value in validated_data.items():
+                setattr(instance, attr, value)
+            instance.save_and_activate()
+            return instance
 
         obj = super().update(instance, validated_data)
         return obj
@@ -315,7 +429,7 @@ class DescricaoBancoSerializer(serializers.ModelSerializer):
 # =========================
 # Conta Bancária do Réu
 # =========================
-class ContaBancariaReuSerializer(serializers.ModelSerializer):
+class ContaBancariaReuSerializer(CachedFieldsModelSerializer):
     """
     Serializer para bancos dos réus.
     Armazena informações do banco: nome, CNPJ e endereço.
@@ -354,16 +468,13 @@ class ContaBancariaReuSerializer(serializers.ModelSerializer):
         return v
 
     def validate_estado(self, v):
-        v = (v or "").upper()
-        if v:
-            validate_uf(v)
-        return v
+        return validate_uf(v) if v else ""
 
 
 # =========================
 # Representante
 # =========================
-class RepresentanteSerializer(serializers.ModelSerializer):
+class RepresentanteSerializer(CachedFieldsModelSerializer):
     """
     CRUD de Representante.
     - Se 'usa_endereco_do_cliente' for True, copiamos o endereço do cliente no create/update.
@@ -400,6 +511,12 @@ class RepresentanteSerializer(serializers.ModelSerializer):
             "atualizado_em",
         ]
         read_only_fields = ["criado_em", "atualizado_em"]
+        # Unicidade (cliente, cpf): a cargo da constraint unique_representante_por_cliente
+        validators = []
+
+    CPF_DUPLICADO = {"cpf": ["Já existe um representante com este CPF para este cliente."]}
+    UNIQUE_VIOLATIONS = {"unique_representante_por_cliente": CPF_DUPLICADO}
+    ENDERECO_FIELDS = ("logradouro", "numero", "bairro", "cidade", "cep", "uf")
 
     # Normalizações
     def validate_cpf(self, v):
@@ -414,60 +531,38 @@ class RepresentanteSerializer(serializers.ModelSerializer):
         return v
 
     def validate_uf(self, v):
-        v = (v or "").upper()
-        if v:
-            validate_uf(v)
-        return v
+        return validate_uf(v) if v else ""
 
-    def validate(self, attrs):
-        # Garante unicidade (cliente, cpf)
-        cliente = attrs.get("cliente") or getattr(getattr(self, "instance", None), "cliente", None)
-        cpf = attrs.get("cpf") or getattr(getattr(self, "instance", None), "cpf", None)
-        if cliente and cpf:
-            cpf_norm = only_digits(cpf)
-            qs = Representante.objects.filter(cliente=cliente, cpf=cpf_norm)
-            if self.instance:
-                qs = qs.exclude(pk=self.instance.pk)
-            if qs.exists():
-                raise ValidationError({"cpf": "Já existe um representante com este CPF para este cliente."})
-        return attrs
-
-    def _copy_client_address_if_needed(self, obj: Representante):
+    def _with_client_address(self, validated_data, instance=None):
         """
-        Copia endereço do cliente para o representante se usa_endereco_do_cliente=True.
+        Se usa_endereco_do_cliente=True, copia o endereço do cliente para os dados
+        validados: vai no mesmo INSERT/UPDATE (sem um segundo save()).
         """
-        if not obj.usa_endereco_do_cliente:
-            return
+        usa = validated_data.get("usa_endereco_do_cliente")
+        if usa is None:
+            usa = instance.usa_endereco_do_cliente if instance is not None else False
+        if not usa:
+            return validated_data
+        cliente = validated_data.get("cliente")
+        if cliente is None and instance is not None:
+            cliente = instance.cliente
+        if cliente is not None:
+            validated_data.update({f: getattr(cliente, f) for f in self.ENDERECO_FIELDS})
+        return validated_data
 
-        cliente = obj.cliente
-        dirty = False
-
-        for field in ["logradouro", "numero", "bairro", "cidade", "cep", "uf"]:
-            new_val = getattr(cliente, field)
-            if getattr(obj, field) != new_val:
-                setattr(obj, field, new_val)
-                dirty = True
-
-        if dirty:
-            obj.save(update_fields=["logradouro", "numero", "bairro", "cidade", "cep", "uf"])
-
-    @transaction.atomic
     def create(self, validated_data):
-        obj = super().create(validated_data)
-        self._copy_client_address_if_needed(obj)
-        return obj
+        with _unique_violation_as(self.UNIQUE_VIOLATIONS):
+            return super().create(self._with_client_address(validated_data))
 
-    @transaction.atomic
     def update(self, instance, validated_data):
-        obj = super().update(instance, validated_data)
-        self._copy_client_address_if_needed(obj)
-        return obj
+        with _unique_violation_as(self.UNIQUE_VIOLATIONS):
+            return super().update(instance, self._with_client_address(validated_data, instance))
 
 
 # =========================
 # Contrato
 # =========================
-class ContratoSerializer(serializers.ModelSerializer):
+class ContratoSerializer(EagerLoadingMixin, CachedFieldsModelSerializer):
     cliente_nome = serializers.CharField(source="cliente.nome_completo", read_only=True)
     template_nome = serializers.CharField(source="template.name", read_only=True)
 
@@ -485,6 +580,9 @@ class ContratoSerializer(serializers.ModelSerializer):
             "criado_em",
             "atualizado_em",
         ]
+        list_serializer_class = FastListSerializer
+        # cliente_nome / template_nome leem estas FKs
+        select_related = ("cliente", "template")
         read_only_fields = ["criado_em", "atualizado_em"]
 
     def validate_contratos(self, value):
@@ -506,12 +604,12 @@ class ContratoSerializer(serializers.ModelSerializer):
         """
         if not isinstance(value, list):
             raise ValidationError("O campo 'contratos' deve ser uma lista.")
-        
-        # Valida que cada item é um dicionário (objeto)
-        for idx, item in enumerate(value):
-            if not isinstance(item, dict):
-                raise ValidationError(
-                    f"O item {idx} do array 'contratos' deve ser um objeto (dicionário)."
-                )
-        
+
+        # Valida que cada item é um dicionário (objeto); o JSON parseado só produz dict puro
+        if not all(type(item) is dict for item in value):
+            idx = next(i for i, item in enumerate(value) if type(item) is not dict)
+            raise ValidationError(
+                f"O item {idx} do array 'contratos' deve ser um objeto (dicionário)."
+            )
+
         return value
@@ -0,0 +1,41 @@
+# cadastro/signals.py
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import (
+    Cliente,
+    ContaBancaria,
+    Contrato,
+    DescricaoBanco,
+    Representante,
+    schedule_refresh_descricao_banco_ativa,
+)
+
+
+@receiver(post_save, sender=Cliente, dispatch_uid="cadastro_propaga_cliente_nome")
+def propaga_cliente_nome(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Mantém cliente_nome_cache dos filhos (contas, representantes, contratos)
+    alinhado com o nome do cliente. 1 UPDATE por tabela, só nas linhas desatualizadas.
+    """
+    if created:
+        return
+    if update_fields is not None and "nome_completo" not in update_fields:
+        return
+
+    nome = instance.nome_completo
+    for model in (ContaBancaria, Representante, Contrato):
+        model.objects.filter(cliente_id=instance.pk).exclude(
+            cliente_nome_cache=nome
+        ).update(cliente_nome_cache=nome)
+
+
+@receiver(post_save, sender=DescricaoBanco, dispatch_uid="cadastro_refresh_descbanco_ativa_save")
+@receiver(post_delete, sender=DescricaoBanco, dispatch_uid="cadastro_refresh_descbanco_ativa_delete")
+def refresh_descricao_banco_ativa_on_write(sender, instance, using, **kwargs):
+    """
+    Mantém a materialized view de descrições ativas em dia após gravações/exclusões.
+    Roda após o commit: a view enxerga o estado final, incluindo os UPDATEs em lote
+    ("desativa as demais") feitos na mesma transação. 1 refresh por transação.
+    """
+    schedule_refresh_descricao_banco_ativa(using)
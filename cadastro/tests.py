@@ -1,3 +1,296 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+from seal.query import SealedModelIterable
 
-# Create your tests here.
+from accounts.models import User
+from templates_app.models import Template
+
+from .models import (
+    Cliente,
+    ContaBancaria,
+    Contrato,
+    DescricaoBanco,
+    get_descricao_banco_ativa,
+)
+from .filters import ContaBancariaFilter
+from .serializers import ContratoSerializer
+from .views import ContaBancariaViewSet
+
+CPFS = ["52998224725", "11144477735", "39053344705", "15350946056"]
+CNPJ = "11.222.333/0001-81"
+
+
+class ApiTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="tester", password="x")
+        cls.clientes = [
+            Cliente.objects.create(nome_completo=f"Cliente {i}", cpf=cpf)
+            for i, cpf in enumerate(CPFS)
+        ]
+
+    def setUp(self):
+        self.api = APIClient()
+        self.api.force_authenticate(self.user)
+
+    def assertUmaAtiva(self, banco_id):
+        self.assertEqual(DescricaoBanco.objects.filter(banco_id=banco_id, is_ativa=True).count(), 1)
+        # uniq_active_per_banco é DEFERRED: força a checagem sem esperar o commit
+        with connection.cursor() as cursor:
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+            cursor.execute("SET CONSTRAINTS ALL DEFERRED")
+
+
+class PaginacaoTests(ApiTestCase):
+    def test_sem_parametros_devolve_lista_completa(self):
+        r = self.api.get("/api/cadastro/clientes/")
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(r.json()), len(CPFS))
+
+    def test_cursor_percorre_tudo_em_ordem_sem_repetir(self):
+        esperado = list(Cliente.active.order_by("-criado_em", "-id").values_list("id", flat=True))
+        for url in ("/api/cadastro/clientes/?page_size=3", "/api/cadastro/clientes/?lite=1&page_size=3"):
+            vistos, proxima = [], url
+            while proxima:
+                body = self.api.get(proxima).json()
+                self.assertLessEqual(len(body["results"]), 3)
+                vistos += [row["id"] for row in body["results"]]
+                proxima = body["next"]
+            self.assertEqual(vistos, esperado, url)
+
+    def test_cursor_ignora_ordering(self):
+        template = Template.objects.create(name="tpl", file="templates/tpl.docx")
+        for cliente in self.clientes[:3]:
+            Contrato.objects.create(cliente=cliente, template=template)
+        # ordenação por relação (e não única) quebraria o cursor: ao paginar vale (-criado_em, -id)
+        r = self.api.get("/api/cadastro/contratos/?ordering=cliente__nome_completo&page_size=1")
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+        self.assertIsNotNone(r.json()["next"])
+        ultimo = Contrato.objects.order_by("-criado_em", "-id").first()
+        self.assertEqual(r.json()["results"][0]["id"], ultimo.pk)
+
+
+class GetCondicionalTests(ApiTestCase):
+    def test_retrieve_200_304_e_invalida_apos_edicao(self):
+        url = f"/api/cadastro/clientes/{self.clientes[0].pk}/"
+        # GET simples: 1 consulta (o ETag sai da instância lida)
+        with self.assertNumQueries(1):
+            r = self.api.get(url)
+        etag = r["ETag"]
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+
+        with self.assertNumQueries(1):
+            r = self.api.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(r.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.api.patch(url, {"profissao": "Professor"}, format="json")
+        r = self.api.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(r["ETag"], etag)
+
+    def test_retrieve_inexistente_404(self):
+        r = self.api.get("/api/cadastro/clientes/999999/", HTTP_IF_NONE_MATCH='W/"x"')
+        self.assertEqual(r.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_listagem_304_e_invalida_apos_desativar(self):
+        for url in (
+            "/api/cadastro/clientes/",
+            "/api/cadastro/clientes/?lite=1",
+            "/api/cadastro/clientes/?page_size=10",
+        ):
+            etag = self.api.get(url)["ETag"]
+            self.assertEqual(self.api.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+        url = "/api/cadastro/clientes/"
+        etag = self.api.get(url)["ETag"]
+        self.clientes[1].is_active = False
+        self.clientes[1].save()
+        self.assertEqual(self.api.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
+
+
+class CriacaoEmLoteTests(ApiTestCase):
+    def conta(self, cliente, conta, **extra):
+        return {
+            "cliente": cliente.pk, "banco_nome": "BANCO X", "agencia": "1",
+            "conta": str(conta), "digito": "0", **extra,
+        }
+
+    def test_contas_em_lote(self):
+        c0, c1 = self.clientes[:2]
+        payload = [
+            self.conta(c0, 1, is_principal=True, banco_id="001", descricao_banco="Banco X SA"),
+            self.conta(c0, 2),
+            self.conta(c1, 3, is_principal=True, banco_id="001", descricao_banco="Banco X", descricao_set_ativa=True),
+        ]
+        r = self.api.post("/api/cadastro/contas/", payload, format="json")
+        self.assertEqual(r.status_code, status.HTTP_201_CREATED, r.content)
+        self.assertEqual(len(r.json()), 3)
+        self.assertEqual(
+            sorted(ContaBancaria.objects.filter(cliente=c0).values_list("cliente_nome_cache", flat=True)),
+            [c0.nome_completo] * 2,
+        )
+        self.assertEqual(DescricaoBanco.objects.filter(banco_id="001").count(), 2)
+        self.assertEqual(DescricaoBanco.objects.get(banco_id="001", is_ativa=True).nome_banco, "Banco X")
+
+    def test_contas_em_lote_duas_principais_do_mesmo_cliente(self):
+        c0 = self.clientes[0]
+        payload = [self.conta(c0, 1, is_principal=True), self.conta(c0, 2, is_principal=True)]
+        r = self.api.post("/api/cadastro/contas/", payload, format="json")
+        self.assertEqual(r.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ContaBancaria.objects.exists())
+
+    def test_descricoes_em_lote_vale_a_ultima_ativa(self):
+        antiga = DescricaoBanco.objects.create(banco_id="237", banco_nome="BRADESCO", is_ativa=True)
+        payload = [
+            {"banco_id": "237", "banco_nome": "BRADESCO", "nome_banco": "a", "is_ativa": True},
+            {"banco_id": "237", "banco_nome": "BRADESCO", "nome_banco": "b", "is_ativa": True},
+            {"banco_id": "341", "banco_nome": "ITAU", "nome_banco": "c", "is_ativa": False},
+        ]
+        r = self.api.post("/api/cadastro/bancos-descricoes/", payload, format="json")
+        self.assertEqual(r.status_code, status.HTTP_201_CREATED, r.content)
+        antiga.refresh_from_db()
+        self.assertFalse(antiga.is_ativa)
+        self.assertEqual(DescricaoBanco.objects.get(banco_id="237", is_ativa=True).nome_banco, "b")
+        self.assertUmaAtiva("237")
+
+
+class DescricaoAtivaTests(ApiTestCase):
+    def test_criar_ativa_desativa_as_demais(self):
+        for nome in ("a", "b"):
+            r = self.api.post(
+                "/api/cadastro/bancos-descricoes/",
+                {"banco_id": "001", "banco_nome": "BB", "nome_banco": nome, "cnpj": CNPJ, "is_ativa": True},
+                format="json",
+            )
+            self.assertEqual(r.status_code, status.HTTP_201_CREATED, r.content)
+        self.assertEqual(DescricaoBanco.objects.get(banco_id="001", is_ativa=True).nome_banco, "b")
+        self.assertUmaAtiva("001")
+
+    def test_set_ativa(self):
+        a = DescricaoBanco.objects.create(banco_id="001", banco_nome="BB", nome_banco="a", is_ativa=True)
+        b = DescricaoBanco.objects.create(banco_id="001", banco_nome="BB", nome_banco="b")
+        r = self.api.post(f"/api/cadastro/bancos-descricoes/{b.pk}/set-ativa/")
+        self.assertEqual(r.status_code, status.HTTP_200_OK)
+        self.assertTrue(r.json()["is_ativa"])
+        a.refresh_from_db()
+        b.refresh_from_db()
+        self.assertFalse(a.is_ativa)
+        self.assertTrue(b.is_ativa)
+        self.assertEqual(b.atualizado_por, self.user)
+        self.assertUmaAtiva("001")
+
+    def test_bulk_create_with_activation(self):
+        objs = DescricaoBanco.bulk_create_with_activation(
+            [DescricaoBanco(banco_id="104", banco_nome="CAIXA", nome_banco=n, is_ativa=True) for n in "xyz"]
+        )
+        self.assertEqual([o.is_ativa for o in objs], [False, False, True])
+        self.assertUmaAtiva("104")
+
+    def test_view_de_ativas_atualiza_uma_vez_por_transacao(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            DescricaoBanco.create_and_activate(banco_id="001", banco_nome="BB", nome_banco="a")
+            DescricaoBanco.objects.create(banco_id="001", banco_nome="BB", nome_banco="b")
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(get_descricao_banco_ativa("001")["nome_banco"], "a")
+        self.assertEqual(get_descricao_banco_ativa("", "BB")["nome_banco"], "a")
+        self.assertIsNone(get_descricao_banco_ativa("999"))
+
+
+class DescricaoBancoAdminTests(ApiTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.admin = User.objects.create_superuser(username="root", password="x")
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def descricao(self, nome, **extra):
+        return {"banco_id": "001", "banco_nome": "BB", "nome_banco": nome, "cnpj": "", "endereco": "", **extra}
+
+    def test_incluir_segunda_ativa(self):
+        antiga = DescricaoBanco.objects.create(banco_id="001", banco_nome="BB", nome_banco="a", is_ativa=True)
+        r = self.client.post("/admin/cadastro/descricaobanco/add/", self.descricao("b", is_ativa="on"))
+        self.assertEqual(r.status_code, 302, r.context and r.context["adminform"].form.errors)
+        antiga.refresh_from_db()
+        self.assertFalse(antiga.is_ativa)
+        nova = DescricaoBanco.objects.get(banco_id="001", is_ativa=True)
+        self.assertEqual((nova.nome_banco, nova.atualizado_por), ("b", self.admin))
+        self.assertUmaAtiva("001")
+
+    def test_ativar_outra_na_edicao(self):
+        a = DescricaoBanco.objects.create(banco_id="001", banco_nome="BB", nome_banco="a", is_ativa=True)
+        b = DescricaoBanco.objects.create(banco_id="001", banco_nome="BB", nome_banco="b")
+        r = self.client.post(f"/admin/cadastro/descricaobanco/{b.pk}/change/", self.descricao("b2", is_ativa="on"))
+        self.assertEqual(r.status_code, 302, r.context and r.context["adminform"].form.errors)
+        a.refresh_from_db()
+        b.refresh_from_db()
+        self.assertFalse(a.is_ativa)
+        self.assertEqual((b.is_ativa, b.nome_banco), (True, "b2"))
+        self.assertUmaAtiva("001")
+
+
+class SerializersEFiltrosTests(ApiTestCase):
+    def test_listagem_rapida_igual_ao_serializer_por_item(self):
+        template = Template.objects.create(name="tpl", file="templates/tpl.docx")
+        for cliente in self.clientes[:2]:
+            Contrato.objects.create(cliente=cliente, template=template, contratos=[{"numero_do_contrato": "1"}])
+        r = self.api.get("/api/cadastro/contratos/")
+        esperado = [
+            ContratoSerializer(obj).data
+            for obj in Contrato.objects.defer(None).select_related("cliente", "template").order_by("-criado_em")
+        ]
+        self.assertEqual(r.json(), [dict(item) for item in esperado])
+
+    def test_filtros(self):
+        r = self.api.get("/api/cadastro/clientes/", {"nome_icontains": "cliente 1"})
+        self.assertEqual([c["id"] for c in r.json()], [self.clientes[1].pk])
+        r = self.api.get("/api/cadastro/contas/", {"cliente": "abc"})
+        self.assertEqual(r.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_lacre_so_na_listagem(self):
+        # get_object() de retrieve/update/destroy não sai selado (só a listagem)
+        for action, selado in (("list", True), ("retrieve", False), ("partial_update", False)):
+            view = ContaBancariaViewSet(action=action)
+            request = Request(APIRequestFactory().get("/"), parser_context={"view": view})
+            filterset = ContaBancariaFilter(request.query_params, queryset=ContaBancaria.objects.all(), request=request)
+            qs = filterset.qs
+            self.assertEqual(issubclass(qs._iterable_class, SealedModelIterable), selado, action)
+
+
+class ClienteNomeCacheTests(ApiTestCase):
+    def setUp(self):
+        super().setUp()
+        c0 = self.clientes[0]
+        self.pk = ContaBancaria.objects.create(cliente=c0, banco_nome="BB", agencia="1", conta="1").pk
+
+    def test_salvar_sem_trocar_cliente_nao_le_o_cliente(self):
+        conta = ContaBancaria.objects.get(pk=self.pk)
+        conta.agencia = "2"
+        with CaptureQueriesContext(connection) as ctx:
+            conta.save()
+            conta.save(update_fields=["agencia"])
+        self.assertEqual(len(ctx.captured_queries), 2)
+        self.assertFalse(any('"cadastro_cliente"' in q["sql"] for q in ctx.captured_queries))
+
+    def test_trocar_cliente_atualiza_o_cache(self):
+        c1, c2 = self.clientes[1:3]
+        conta = ContaBancaria.objects.get(pk=self.pk)
+        conta.cliente_id = c1.pk
+        conta.save()
+        self.assertEqual(ContaBancaria.objects.get(pk=self.pk).cliente_nome_cache, c1.nome_completo)
+
+        conta = ContaBancaria.objects.only("id").get(pk=self.pk)
+        conta.cliente = c2
+        conta.save(update_fields=["cliente"])
+        self.assertEqual(ContaBancaria.objects.get(pk=self.pk).cliente_nome_cache, c2.nome_completo)
+
+    def test_renomear_cliente_propaga(self):
+        c0 = self.clientes[0]
+        c0.nome_completo = "Outro Nome"
+        c0.save()
+        self.assertEqual(ContaBancaria.objects.get(pk=self.pk).cliente_nome_cache, "Outro Nome")
@@ -1,23 +1,81 @@
 import re
+from functools import lru_cache
+from operator import mul
 from typing import Optional
 
 from django.core.exceptions import ValidationError
-from stdnum.br import cpf as cpfmod
-from stdnum.br import cnpj as cnpjmod
 
 # Conjunto de UFs válidas
-UF_LIST = {
+UF_LIST = frozenset({
     "AC","AL","AP","AM","BA","CE","DF","ES","GO","MA","MT","MS","MG",
     "PA","PB","PR","PE","PI","RJ","RN","RS","RO","RR","SC","SP","SE","TO"
-}
+})
 
 
 # =========================
 # Normalizações básicas
 # =========================
+_NON_DIGITS_RE = re.compile(r"\D+")
+# Caracteres de máscara usuais em CPF/CNPJ/CEP/telefone: removidos via
+# str.translate (laço em C), evitando o regex no caso comum.
+_MASK_TABLE = str.maketrans("", "", ".-/ ()")
+
+
+@lru_cache(maxsize=4096)
 def only_digits(value: Optional[str]) -> str:
     """Remove tudo que não for dígito. Aceita None e retorna ''."""
-    return re.sub(r"\D+", "", value or "")
+    if not value:
+        return ""
+    digits = value.translate(_MASK_TABLE)
+    if digits.isdecimal() or not digits:
+        return digits
+    return _NON_DIGITS_RE.sub("", digits)
+
+
+def _digits_of_len(value: Optional[str], tamanho: int) -> str:
+    """only_digits(), mas devolve o próprio valor se já vier com `tamanho` dígitos."""
+    if value and len(value) == tamanho and value.isdecimal():
+        return value
+    return only_digits(value)
+
+
+# =========================
+# Dígitos verificadores (CPF/CNPJ)
+# =========================
+# Pesos do módulo 11 já expandidos; cada DV é (11 - soma) % 11 % 10.
+_CPF_PESOS_DV1 = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+_CPF_PESOS_DV2 = (11, 10, 9, 8, 7, 6, 5, 4, 3, 2)
+_CNPJ_PESOS_DV1 = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+_CNPJ_PESOS_DV2 = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
+
+def _dv(nums, pesos) -> int:
+    return (11 - sum(map(mul, pesos, nums))) % 11 % 10
+
+
+def _dvs_conferem(digits: str, tamanho: int, pesos_dv1, pesos_dv2) -> bool:
+    """Confere tamanho, só dígitos ASCII, não-zero e os dois DVs finais."""
+    if len(digits) != tamanho or not (digits.isascii() and digits.isdigit()):
+        return False
+    if not digits.strip("0"):
+        return False
+    nums = [ord(c) - 48 for c in digits]
+    dv1 = _dv(nums, pesos_dv1)
+    if dv1 != nums[-2]:
+        return False
+    return _dv(nums, pesos_dv2) == nums[-1]
+
+
+@lru_cache(maxsize=4096)
+def cpf_is_valid(digits: str) -> bool:
+    """CPF (somente dígitos) com DVs corretos."""
+    return _dvs_conferem(digits, 11, _CPF_PESOS_DV1, _CPF_PESOS_DV2)
+
+
+@lru_cache(maxsize=4096)
+def cnpj_is_valid(digits: str) -> bool:
+    """CNPJ (somente dígitos) com DVs corretos."""
+    return _dvs_conferem(digits, 14, _CNPJ_PESOS_DV1, _CNPJ_PESOS_DV2)
 
 
 # =========================
@@ -28,8 +86,8 @@ def validate_cpf(value: str) -> None:
     Valida CPF (com ou sem máscara). Lança ValidationError se inválido.
     Normalização (remover máscara) fica a cargo de serializers/models.
     """
-    digits = only_digits(value)
-    if not cpfmod.is_valid(digits):
+    digits = _digits_of_len(value, 11)
+    if not cpf_is_valid(digits):
         raise ValidationError("CPF inválido.")
 
 
@@ -38,8 +96,8 @@ def validate_cnpj(value: str) -> None:
     Valida CNPJ (com ou sem máscara). Lança ValidationError se inválido.
     Normalização (remover máscara) fica a cargo de serializers/models.
     """
-    digits = only_digits(value)
-    if not cnpjmod.is_valid(digits):
+    digits = _digits_of_len(value, 14)
+    if not cnpj_is_valid(digits):
         raise ValidationError("CNPJ inválido.")
 
 
@@ -47,20 +105,23 @@ def validate_cep(value: str) -> None:
     """
     Valida CEP: exatamente 8 dígitos (sem máscara).
     """
-    digits = only_digits(value)
+    digits = _digits_of_len(value, 8)
     if len(digits) != 8:
         raise ValidationError("CEP deve ter 8 dígitos (somente números).")
 
 
-def validate_uf(value: str) -> None:
+def validate_uf(value: str) -> str:
     """
     Valida UF: precisa estar presente e ser uma das siglas conhecidas.
+    Retorna a sigla em maiúsculas.
     Observação: se o campo for opcional, cheque 'if value:' antes de chamar.
     """
     if not value:
         raise ValidationError("UF é obrigatório.")
-    if value.upper() not in UF_LIST:
+    v = value.upper()
+    if v not in UF_LIST:
         raise ValidationError("UF inválida.")
+    return v
 
 
 # =========================
@@ -73,13 +134,26 @@ def validate_uf(value: str) -> None:
 _BANK_ID_RE = re.compile(r"^(?:\d{3}|\d{8}|[A-Z0-9][A-Z0-9_-]{1,30}[A-Z0-9])$")
 
 
+@lru_cache(maxsize=1024)
+def _banco_id_normalizado(value: Optional[str]) -> Optional[str]:
+    """banco_id normalizado (maiúsculas) ou None se inválido; cacheado por valor."""
+    v = (value or "").strip().upper()
+    # caso comum (COMPE/ISPB só com dígitos) sem passar pelo regex;
+    # isdecimal() casa exatamente o \d do padrão
+    if len(v) in (3, 8) and v.isdecimal():
+        return v
+    if v and not _BANK_ID_RE.match(v):
+        return None
+    return v
+
+
 def validate_banco_id(value: str) -> str:
     """
     Valida e normaliza 'banco_id' para maiúsculas.
     Retorna a string normalizada.
     """
-    v = (value or "").strip().upper()
-    if v and not _BANK_ID_RE.match(v):
+    v = _banco_id_normalizado(value)
+    if v is None:
         raise ValidationError(
             "banco_id deve ser COMPE (3 dígitos), ISPB (8 dígitos) ou slug A–Z/0–9/_/- (3–32)."
         )
@@ -96,6 +170,11 @@ def validate_compe(value: str) -> str:
     return v
 
 
+_BANK_SLUG_SEP_RE = re.compile(r"[\s\.]+")
+_BANK_SLUG_INVALID_RE = re.compile(r"[^A-Z0-9_-]")
+
+
+@lru_cache(maxsize=1024)
 def normalize_bank_id(value: str) -> str:
     """
     Normaliza IDs não-numéricos para um slug seguro (A–Z/0–9/_/-), máx. 32 chars.
@@ -103,8 +182,8 @@ def normalize_bank_id(value: str) -> str:
     """
     v = (value or "").upper().strip()
     # troca espaços/pontos por hífen e remove o resto que não seja A–Z/0–9/_/-
-    v = re.sub(r"[\s\.]+", "-", v)
-    v = re.sub(r"[^A-Z0-9_-]", "", v)
+    v = _BANK_SLUG_SEP_RE.sub("-", v)
+    v = _BANK_SLUG_INVALID_RE.sub("", v)
     # limita a 32 caracteres e remove hífens/underscores nas pontas
     v = v[:32].strip("-_")
     return v
@@ -1,9 +1,29 @@
 # cadastro/views.py
+
 from rest_framework import viewsets, permissions, filters, decorators, response, status
 from django_filters.rest_framework import DjangoFilterBackend
+from django.utils import timezone
+
+from common.views import AtualizadoEmETagMixin
+from jurisdoc.pagination import OptionalCursorPagination
 
 from .models import Cliente, ContaBancaria, ContaBancariaReu, DescricaoBanco, Representante, Contrato
-from .filters import ClienteFilter, ContaBancariaFilter, DescricaoBancoFilter
+from .filters import (
+    ClienteFilter,
+    ContaBancariaFilter,
+    ContaBancariaReuFilter,
+    ContratoFilter,
+    DescricaoBancoFilter,
+    RepresentanteFilter,
+)
+from .serializers import (
+    ClienteSerializer,
+    ContaBancariaSerializer,
+    ContaBancariaReuSerializer,
+    ContratoSerializer,
+    DescricaoBancoSerializer,
+    RepresentanteSerializer,
+)
 
 
 # Se quiser manter a classe abaixo para uso futuro, tudo bem,
@@ -13,10 +33,27 @@ class IsAdmin(permissions.BasePermission):
         return bool(request.user and request.user.is_authenticated and getattr(request.user, "is_admin", False))
 
 
-class ClienteViewSet(viewsets.ModelViewSet):
-    queryset = Cliente.objects.filter(is_active=True).order_by("nome_completo")
+def _lite_requested(request):
+    """?lite=1: listagem enxuta lida com .values(), sem model/serializer."""
+    return request.query_params.get("lite", "").lower() in ("1", "true")
+
+
+def _localize_datetimes(rows, *fields):
+    """Datetimes de linhas .values() no mesmo formato do serializer (fuso local)."""
+    for row in rows:
+        for f in fields:
+            if row[f] is not None:
+                row[f] = timezone.localtime(row[f]).isoformat()
+    return rows
+
+
+class ClienteViewSet(AtualizadoEmETagMixin, viewsets.ModelViewSet):
+    queryset = Cliente.active.order_by("nome_completo")
     permission_classes = [permissions.IsAuthenticated]
-    serializer_class = None  # setado no get_serializer_class
+    serializer_class = ClienteSerializer
+    pagination_class = OptionalCursorPagination
+    # listagem ordenada por nome: toda mudança nela passa por save() (soft delete incluso)
+    etag_list = True
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = ClienteFilter
     search_fields = [
@@ -43,19 +80,30 @@ class ClienteViewSet(viewsets.ModelViewSet):
         Para ver inativos, use ?is_active=false na query.
         Para ver todos, use ?is_active= (vazio) ou não passe o parâmetro e use o filtro manualmente.
         """
-        qs = Cliente.objects.all().order_by("nome_completo")
-        is_active_param = self.request.query_params.get("is_active")
-        
-        # Se não foi especificado, filtra apenas ativos por padrão
-        if is_active_param is None:
-            qs = qs.filter(is_active=True)
-        
-        # Se foi especificado, o django-filters vai aplicar o filtro
-        return qs
+        # Sem o parâmetro: só ativos. Com ele, o django-filters aplica o filtro
+        manager = Cliente.active if "is_active" not in self.request.query_params else Cliente.objects
+        # search_vec (tsvector) só serve p/ filtrar no banco; o serializer não o devolve
+        return manager.defer("search_vec").order_by("nome_completo")
 
-    def get_serializer_class(self):
-        from .serializers import ClienteSerializer
-        return ClienteSerializer
+    # Colunas da listagem enxuta (?lite=1), p/ seletores/autocomplete do front
+    LITE_FIELDS = ("id", "nome_completo", "cpf", "cidade", "uf", "criado_em")
+
+    def list(self, request, *args, **kwargs):
+        """
+        ?lite=1: mesma filtragem/ordenação/busca, mas devolve só LITE_FIELDS lidos
+        direto do banco com .values() (sem instanciar models nem serializer).
+        """
+        if not _lite_requested(request):
+            return super().list(request, *args, **kwargs)
+        # atualizado_em só é lido para o ETag
+        qs = self.filter_queryset(self.get_queryset()).values(*self.LITE_FIELDS, "atualizado_em")
+        return self._etag_listing(request, qs, self._lite_rows)
+
+    @staticmethod
+    def _lite_rows(rows):
+        for row in rows:
+            del row["atualizado_em"]
+        return _localize_datetimes(rows, "criado_em")
 
     def destroy(self, request, *args, **kwargs):
         """
@@ -83,23 +131,47 @@ class ClienteViewSet(viewsets.ModelViewSet):
         return response.Response(ser.data, status=status.HTTP_200_OK)
 
 
-class ContaBancariaViewSet(viewsets.ModelViewSet):
-    queryset = (
-        ContaBancaria.objects.select_related("cliente")
-        .all()
-        .order_by("cliente__nome_completo", "banco_nome")
-    )
+class ContaBancariaViewSet(AtualizadoEmETagMixin, viewsets.ModelViewSet):
+    # ETag só no retrieve: a listagem ordena por cliente_nome_cache, que o signal
+    # de renomear cliente atualiza via QuerySet.update() (sem tocar em atualizado_em)
+    queryset = ContaBancaria.objects.order_by("cliente_nome_cache", "banco_nome")
     permission_classes = [permissions.IsAuthenticated]
-    serializer_class = None
+    serializer_class = ContaBancariaSerializer
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = ContaBancariaFilter
-    filterset_fields = ["cliente", "banco_nome", "tipo", "is_principal"]
-    search_fields = ["banco_nome", "agencia", "conta", "cliente__nome_completo"]
+    search_fields = ["banco_nome", "agencia", "conta", "cliente_nome_cache"]
     ordering_fields = ["banco_nome", "agencia", "conta", "criado_em", "is_principal"]
 
-    def get_serializer_class(self):
-        from .serializers import ContaBancariaSerializer
-        return ContaBancariaSerializer
+    def get_queryset(self):
+        qs = super().get_queryset()
+        # a leitura só expõe cliente_id; a escrita lê o cliente (nome p/ o cache e a
+        # regra da conta principal), então só ela faz o JOIN
+        if self.action not in ("list", "retrieve"):
+            qs = qs.select_related("cliente")
+        return qs
+
+    def get_serializer(self, *args, **kwargs):
+        # Criação em lote: POST com uma lista de contas
+        data = kwargs.get("data")
+        if isinstance(data, list):
+            kwargs["many"] = True
+            context = kwargs.setdefault("context", self.get_serializer_context())
+            context["clientes_com_principal"] = self._clientes_com_principal(data)
+        return super().get_serializer(*args, **kwargs)
+
+    def _clientes_com_principal(self, items):
+        """IDs (do lote) de clientes que já têm conta principal: 1 query para o lote todo."""
+        ids = {
+            str(item.get("cliente"))
+            for item in items
+            if isinstance(item, dict) and str(item.get("cliente", "")).isdigit()
+        }
+        if not ids:
+            return set()
+        return set(
+            ContaBancaria.objects.filter(cliente_id__in=ids, is_principal=True)
+            .values_list("cliente_id", flat=True)
+        )
 
 
 class DescricaoBancoViewSet(viewsets.ModelViewSet):
@@ -110,19 +182,23 @@ class DescricaoBancoViewSet(viewsets.ModelViewSet):
       - GET  /api/cadastro/bancos-descricoes/lookup/?bank_id=...  → retorna a ATIVA (200) ou 204 se nenhuma existir
       - GET  /api/cadastro/bancos-descricoes/variacoes/?bank_id=... → lista TODAS as descrições do banco (ordenadas: ativa primeiro)
       - POST /api/cadastro/bancos-descricoes/                     → cria nova descrição (pode vir com is_ativa=True)
+                                                                   (ou uma lista delas, em lote)
       - PATCH/PUT /api/cadastro/bancos-descricoes/{id}/           → edita a descrição (pode marcar is_ativa=True)
       - POST/PATCH /api/cadastro/bancos-descricoes/{id}/set-ativa/→ marca esta como ativa (desativa as demais do mesmo banco)
     """
 
     permission_classes = [permissions.IsAuthenticated]
+    serializer_class = DescricaoBancoSerializer
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = DescricaoBancoFilter
     search_fields = ["banco_nome", "nome_banco", "cnpj", "endereco", "banco_id"]
     ordering_fields = ["banco_nome", "is_ativa", "atualizado_em", "criado_em"]
 
-    def get_serializer_class(self):
-        from .serializers import DescricaoBancoSerializer
-        return DescricaoBancoSerializer
+    def get_serializer(self, *args, **kwargs):
+        # Criação em lote: POST com uma lista de descrições
+        if isinstance(kwargs.get("data"), list):
+            kwargs["many"] = True
+        return super().get_serializer(*args, **kwargs)
 
     def get_queryset(self):
         """
@@ -162,21 +238,22 @@ class DescricaoBancoViewSet(viewsets.ModelViewSet):
         else:
             qs = qs.filter(banco_nome=bank_name)
 
-        obj = (
-            qs.filter(is_ativa=True).order_by("-atualizado_em").first()
-            or qs.order_by("-is_ativa", "-atualizado_em").first()
-        )
+        # ativa primeiro; sem ativa, a mais recente — numa só consulta (LIMIT 1)
+        obj = qs.order_by("-is_ativa", "-atualizado_em").first()
         if not obj:
             return response.Response(status=status.HTTP_204_NO_CONTENT)
 
         ser = self.get_serializer(obj)
         return response.Response(ser.data, status=status.HTTP_200_OK)
 
+    # Colunas de variacoes?lite=1 (seletor de descrição no front)
+    LITE_FIELDS = ("id", "banco_id", "banco_nome", "nome_banco", "is_ativa", "atualizado_em")
+
     @decorators.action(detail=False, methods=["get"], url_path="variacoes")
     def variacoes(self, request):
         """
         Lista todas as descrições de um banco.
-        - Params: bank_id=...
+        - Params: bank_id=... [lite=1: só LITE_FIELDS, via .values()]
         """
         bank_id = request.query_params.get("bank_id") or request.query_params.get("banco_id")
         if not bank_id:
@@ -186,6 +263,9 @@ class DescricaoBancoViewSet(viewsets.ModelViewSet):
             )
 
         qs = self.get_queryset().filter(banco_id=bank_id).order_by("-is_ativa", "-atualizado_em")
+        if _lite_requested(request):
+            rows = _localize_datetimes(list(qs.values(*self.LITE_FIELDS)), "atualizado_em")
+            return response.Response(rows, status=status.HTTP_200_OK)
         ser = self.get_serializer(qs, many=True)
         return response.Response(ser.data, status=status.HTTP_200_OK)
 
@@ -195,15 +275,10 @@ class DescricaoBancoViewSet(viewsets.ModelViewSet):
         Marca esta descrição (id) como ATIVA e desativa as demais do mesmo banco.
         """
         obj = self.get_object()
-        from .serializers import DescricaoBancoSerializer  # evita import circular
-        ser = DescricaoBancoSerializer(
-            obj,
-            data={"is_ativa": True},
-            partial=True,
-            context={"request": request},
-        )
-        ser.is_valid(raise_exception=True)
-        ser.save()
+        # só troca a ativa: sem validar o serializer, numa única instrução (CTE)
+        obj.atualizado_por = request.user
+        obj.save_and_activate()
+        ser = self.get_serializer(obj)
         return response.Response(ser.data, status=status.HTTP_200_OK)
 
 
@@ -215,19 +290,12 @@ class RepresentanteViewSet(viewsets.ModelViewSet):
     CRUD de Representantes de Cliente.
     - Cópia de endereço do cliente é feita no serializer quando 'usa_endereco_do_cliente=True'.
     """
-    queryset = Representante.objects.select_related("cliente").all().order_by("cliente__nome_completo", "nome_completo")
+    queryset = Representante.objects.order_by("cliente_nome_cache", "nome_completo")
     permission_classes = [permissions.IsAuthenticated]
-    serializer_class = None  # setado no get_serializer_class
+    serializer_class = RepresentanteSerializer
 
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    # Usamos filterset_fields simples para não depender de um filtro customizado
-    filterset_fields = [
-        "cliente",
-        "cpf",
-        "se_idoso",
-        "se_incapaz",
-        "se_crianca_adolescente",
-    ]
+    filterset_class = RepresentanteFilter
     search_fields = [
         "nome_completo",
         "cpf",
@@ -235,7 +303,7 @@ class RepresentanteViewSet(viewsets.ModelViewSet):
         "bairro",
         "profissao",
         "nacionalidade",
-        "cliente__nome_completo",
+        "cliente_nome_cache",
     ]
     ordering_fields = [
         "nome_completo",
@@ -244,9 +312,18 @@ class RepresentanteViewSet(viewsets.ModelViewSet):
         "cliente__nome_completo",
     ]
 
-    def get_serializer_class(self):
-        from .serializers import RepresentanteSerializer
-        return RepresentanteSerializer
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if self.action in ("list", "retrieve"):
+            # a leitura só expõe cliente_id (sem JOIN) e não devolve o search_vec
+            return qs.defer("search_vec")
+        # escrita: do cliente só lemos o nome (cliente_nome_cache) e o endereço
+        # (usa_endereco_do_cliente); o resto das colunas fica fora do JOIN
+        cliente_fields = ("nome_completo", *RepresentanteSerializer.ENDERECO_FIELDS)
+        return qs.select_related("cliente").only(
+            *(f.name for f in Representante._meta.concrete_fields if not f.generated),
+            *(f"cliente__{f}" for f in cliente_fields),
+        )
 
 
 # --------------------------------------------------------------------
@@ -262,16 +339,12 @@ class ContaBancariaReuViewSet(viewsets.ModelViewSet):
         .order_by("banco_nome")
     )
     permission_classes = [permissions.IsAuthenticated]
-    serializer_class = None
+    serializer_class = ContaBancariaReuSerializer
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ["banco_nome", "banco_codigo", "cidade", "estado"]
+    filterset_class = ContaBancariaReuFilter
     search_fields = ["banco_nome", "cnpj", "cidade"]
     ordering_fields = ["banco_nome", "criado_em"]
 
-    def get_serializer_class(self):
-        from .serializers import ContaBancariaReuSerializer
-        return ContaBancariaReuSerializer
-
 
 # --------------------------------------------------------------------
 # Contratos
@@ -284,18 +357,18 @@ class ContratoViewSet(viewsets.ModelViewSet):
     - Não usa CASCADE: ao deletar o contrato, não afeta cliente ou template.
     """
     queryset = (
-        Contrato.objects.select_related("cliente", "template")
-        .all()
+        Contrato.objects.defer(None)  # o serializer expõe imagem_do_contrato e verifica_documento
         .order_by("-criado_em")
     )
     permission_classes = [permissions.IsAuthenticated]
-    serializer_class = None
+    serializer_class = ContratoSerializer
+    pagination_class = OptionalCursorPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ["cliente", "template"]
-    search_fields = ["cliente__nome_completo", "template__name"]
+    filterset_class = ContratoFilter
+    search_fields = ["cliente_nome_cache", "template__name"]
     ordering_fields = ["criado_em", "atualizado_em", "cliente__nome_completo"]
 
-    def get_serializer_class(self):
-        from .serializers import ContratoSerializer
-        return ContratoSerializer
+    def get_queryset(self):
+        # JOINs declarados no Meta do serializer (cliente/template)
+        return ContratoSerializer.setup_eager_loading(super().get_queryset())
 
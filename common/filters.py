@@ -0,0 +1,40 @@
+# common/filters.py
+import django_filters as df
+from seal.query import SealableQuerySet
+
+
+class LazyFilterSet(df.FilterSet):
+    """
+    FilterSet que não monta/valida o form quando a requisição não traz
+    nenhum parâmetro de filtro (caso comum das listagens sem busca).
+    Na listagem (action "list") querysets de modelos SealableModel saem selados
+    (django-seal); get_object() de retrieve/update/destroy recebe o queryset normal.
+    """
+
+    def _is_list_action(self):
+        # DRF: a view chega ao FilterSet pelo parser_context do Request
+        context = getattr(self.request, "parser_context", None) or {}
+        return getattr(context.get("view"), "action", None) == "list"
+
+    def has_filter_params(self):
+        if not self.data:
+            return False
+        names = self.base_filters
+        for key in self.data:
+            # aceita sufixos (ex.: filtros de intervalo "<nome>_after")
+            if key in names or any(key.startswith(f"{name}_") for name in names):
+                return True
+        return False
+
+    def is_valid(self):
+        return not self.has_filter_params() or super().is_valid()
+
+    @property
+    def qs(self):
+        if not hasattr(self, "_qs"):
+            qs = super().qs if self.has_filter_params() else self.queryset.all()
+            # selado: acesso a relação não pré-carregada (N+1) emite UnsealedAttributeAccess
+            if isinstance(qs, SealableQuerySet) and qs._fields is None and self._is_list_action():
+                qs = qs.seal()
+            self._qs = qs
+        return self._qs
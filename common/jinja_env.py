@@ -1,14 +1,32 @@
 # common/jinja_env.py  (crie um pequeno módulo numa app comum sua)
+import re
+from functools import lru_cache
+
 from jinja2 import Environment, StrictUndefined
 
-def _digits(v): return "".join(ch for ch in str(v) if ch.isdigit())
+_NON_DIGITS_RE = re.compile(r"\D+")
+
+def _digits(s: str) -> str: return s if s.isdecimal() else _NON_DIGITS_RE.sub("", s)
+
+# cacheados pela string de entrada (o mesmo CPF/CEP se repete nos laços do template);
+# None = sem o nº de dígitos esperado, o filtro devolve o valor original
+@lru_cache(maxsize=4096)
+def _cpf_format(raw: str):
+    s = _digits(raw); return f"{s[:3]}.{s[3:6]}.{s[6:9]}-{s[9:11]}" if len(s)==11 else None
+
+@lru_cache(maxsize=4096)
+def _cep_format(raw: str):
+    s = _digits(raw); return f"{s[:5]}-{s[5:8]}" if len(s)==8 else None
 
 def cpf_format(v):
-    s = _digits(v); return f"{s[:3]}.{s[3:6]}.{s[6:9]}-{s[9:11]}" if len(s)==11 else v
+    s = _cpf_format(str(v)); return v if s is None else s
 
 def cep_format(v):
-    s = _digits(v); return f"{s[:5]}-{s[5:8]}" if len(s)==8 else v
+    s = _cep_format(str(v)); return v if s is None else s
 
+# 1 Environment por processo: filtros sem estado e render thread-safe. O docxtpl só
+# toca em env.autoescape no render (sempre False aqui), então pode ser compartilhado
+@lru_cache(maxsize=1)
 def build_env() -> Environment:
     env = Environment(undefined=StrictUndefined, autoescape=False)
     env.filters.update({
@@ -0,0 +1,17 @@
+# common/parsers.py
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+
+class ORJSONParser(JSONParser):
+    """
+    JSONParser com orjson (parser em C): corpo JSON decodificado direto dos bytes.
+    Igual ao padrão do DRF em modo estrito (NaN/Infinity são rejeitados).
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read() if stream is not None else b"")
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -0,0 +1,89 @@
+# common/serializers.py
+import copy
+
+from django.db import models
+from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+
+
+class EagerLoadingMixin:
+    """
+    Serializer que declara no Meta as relações que lê (select_related /
+    prefetch_related); a view aplica com setup_eager_loading(queryset).
+    """
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        meta = getattr(cls, "Meta", None)
+        select = getattr(meta, "select_related", ())
+        prefetch = getattr(meta, "prefetch_related", ())
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
+
+
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer que monta o dicionário de campos uma única vez por classe.
+
+    O DRF refaz a introspecção do Meta/model em toda instância (get_fields);
+    aqui guardamos o resultado por classe e devolvemos cópias rasas, que são
+    ligadas (bind) normalmente ao serializer da vez.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        cached = self._fields_cache.get(cls)
+        if cached is None:
+            cached = self._fields_cache[cls] = super().get_fields()
+        return {name: copy.copy(field) for name, field in cached.items()}
+
+
+class FastListSerializer(serializers.ListSerializer):
+    """
+    ListSerializer para listagens grandes.
+
+    Decide uma única vez, por listagem, como cada campo é lido: campos simples
+    do model viram getattr + to_representation por linha; os demais (relações,
+    fontes aninhadas, SerializerMethodField) seguem o caminho normal do DRF.
+    A saída é idêntica à do ListSerializer padrão.
+    """
+
+    def _read_plan(self):
+        child = self.child
+        simple = {
+            f.name
+            for f in child.Meta.model._meta.concrete_fields
+            if not f.is_relation
+        }
+        plan = []
+        for field in child._readable_fields:
+            attrs = field.source_attrs
+            attr = attrs[0] if len(attrs) == 1 and attrs[0] in simple else None
+            plan.append((field.field_name, attr, field))
+        return plan
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        plan = self._read_plan()
+        rows = []
+        for instance in iterable:
+            row = {}
+            for name, attr, field in plan:
+                if attr is not None:
+                    value = getattr(instance, attr)
+                    row[name] = None if value is None else field.to_representation(value)
+                    continue
+                try:
+                    value = field.get_attribute(instance)
+                except SkipField:
+                    continue
+                check = value.pk if isinstance(value, PKOnlyObject) else value
+                row[name] = None if check is None else field.to_representation(value)
+            rows.append(row)
+        return rows
@@ -0,0 +1,90 @@
+# common/views.py
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from rest_framework.response import Response
+
+
+def _atualizado_em(row):
+    return row["atualizado_em"] if isinstance(row, dict) else row.atualizado_em
+
+
+class AtualizadoEmETagMixin:
+    """
+    GET condicional (If-None-Match) com ETag fraco derivado de atualizado_em:
+    se o cliente HTTP já tem a versão atual, responde 304 sem serializar.
+
+    - retrieve: (pk, atualizado_em) do registro. A consulta prévia só roda quando a
+      requisição traz If-None-Match; no 200 o ETag sai da própria instância.
+    - list (etag_list=True): query string + nº de linhas/max(atualizado_em) do que é
+      devolvido. Página do cursor: calculado sobre as linhas da página (lidas de
+      qualquer forma); lista inteira: count/max no banco só com If-None-Match.
+      Só ligue se toda mudança visível na listagem (inclusive na ordenação) passar
+      por save() — QuerySet.update() não mexe em atualizado_em.
+    """
+
+    etag_list = False
+
+    def _etag(self, *parts) -> str:
+        # os campos do serializer entram no hash: mudou o formato, muda o ETag
+        raw = "|".join(map(str, (*self.get_serializer_class().Meta.fields, *parts)))
+        return f'W/"{hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()}"'
+
+    def _rows_etag(self, request, rows) -> str:
+        ultimo = max(map(_atualizado_em, rows), default=None)
+        return self._etag(request.get_full_path(), len(rows), ultimo)
+
+    def _etag_listing(self, request, queryset, serialize):
+        """
+        Listagem com ETag: `serialize(rows)` só roda se não couber 304. Com
+        If-None-Match e sem paginação, count/max no banco evitam ler a lista inteira.
+        """
+        page = self.paginate_queryset(queryset)
+        rows = page
+        if page is not None:
+            etag = self._rows_etag(request, page)
+        elif "HTTP_IF_NONE_MATCH" in request.META:
+            agg = queryset.order_by().aggregate(n=Count("pk"), ultimo=Max("atualizado_em"))
+            etag = self._etag(request.get_full_path(), agg["n"], agg["ultimo"])
+        else:
+            rows = list(queryset)
+            etag = self._rows_etag(request, rows)
+
+        resp = get_conditional_response(request, etag=etag)
+        if resp is None:
+            data = serialize(list(queryset) if rows is None else rows)
+            resp = self.get_paginated_response(data) if page is not None else Response(data)
+        resp["ETag"] = etag
+        return resp
+
+    def list(self, request, *args, **kwargs):
+        if not self.etag_list:
+            return super().list(request, *args, **kwargs)
+        return self._etag_listing(
+            request,
+            self.filter_queryset(self.get_queryset()),
+            lambda rows: self.get_serializer(rows, many=True).data,
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        if "HTTP_IF_NONE_MATCH" in request.META:
+            lookup = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+            row = (
+                self.filter_queryset(self.get_queryset())
+                .filter(**{self.lookup_field: lookup})
+                .values_list("pk", "atualizado_em")
+                .first()
+            )
+            # inexistente: segue o fluxo normal (404 do get_object)
+            if row is not None:
+                etag = self._etag(*row)
+                resp = get_conditional_response(request, etag=etag)
+                if resp is not None:
+                    resp["ETag"] = etag
+                    return resp
+
+        instance = self.get_object()
+        resp = Response(self.get_serializer(instance).data)
+        resp["ETag"] = self._etag(instance.pk, instance.atualizado_em)
+        return resp
@@ -33,6 +33,7 @@ class ContratoAdmin(admin.ModelAdmin):
     date_hierarchy = "data_inclusao"
     ordering = ("-criado_em",)
     autocomplete_fields = ("cliente",)
+    list_select_related = ("cliente", "criado_por")  # colunas FK do list_display sem N+1
     readonly_fields = ("criado_em", "atualizado_em")
 
     fieldsets = (
@@ -0,0 +1,9 @@
+# contracts/filters.py
+from common.filters import LazyFilterSet
+from .models import Contrato
+
+
+class ContratoFilter(LazyFilterSet):
+    class Meta:
+        model = Contrato
+        fields = ["cliente", "situacao", "origem_averbacao"]
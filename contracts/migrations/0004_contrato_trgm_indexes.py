@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-14 18:33
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastro', '0031_cursor_pagination_indexes'),
+        ('contracts', '0003_alter_contrato_origem_averbacao_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contrato',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('numero_contrato'), name='gin_trgm_ops'), name='contrato_numero_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contrato',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('banco_nome'), name='gin_trgm_ops'), name='contrato_banco_trgm_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-14 18:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cadastro', '0031_cursor_pagination_indexes'),
+        ('contracts', '0004_contrato_trgm_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # registros antigos com fim antes do início (gravados antes da validação do
+        # serializer): o fim fica "não informado" para o CHECK poder ser criado
+        migrations.RunSQL(
+            sql=(
+                "UPDATE contracts_contrato SET data_fim_desconto = NULL "
+                "WHERE data_fim_desconto < data_inicio_desconto"
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddConstraint(
+            model_name='contrato',
+            constraint=models.CheckConstraint(condition=models.Q(('data_fim_desconto__gte', models.F('data_inicio_desconto')), ('data_fim_desconto__isnull', True), ('data_inicio_desconto__isnull', True), _connector='OR'), name='ck_contrato_datas'),
+        ),
+    ]
@@ -1,4 +1,7 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models import F, Q
+from django.db.models.functions import Upper
 from django.conf import settings
 
 from cadastro.models import Cliente
@@ -117,6 +120,9 @@ class Contrato(models.Model):
         ordering = ["-criado_em", "cliente", "numero_contrato"]
         indexes = [
             models.Index(fields=["cliente", "numero_contrato"]),
+            # pg_trgm: search_fields do ContratoViewSet (UPPER(col) LIKE UPPER('%x%'))
+            GinIndex(OpClass(Upper("numero_contrato"), name="gin_trgm_ops"), name="contrato_numero_trgm_idx"),
+            GinIndex(OpClass(Upper("banco_nome"), name="gin_trgm_ops"), name="contrato_banco_trgm_idx"),
         ]
         constraints = [
             # não é UNIQUE duro porque pode haver recontratação mesmo número,
@@ -125,6 +131,13 @@ class Contrato(models.Model):
             #     fields=["cliente", "numero_contrato"],
             #     name="unique_contrato_por_cliente",
             # ),
+            # fim do desconto não antes do início (o serializer valida antes, com mensagem)
+            models.CheckConstraint(
+                condition=Q(data_fim_desconto__gte=F("data_inicio_desconto"))
+                | Q(data_fim_desconto__isnull=True)
+                | Q(data_inicio_desconto__isnull=True),
+                name="ck_contrato_datas",
+            ),
         ]
 
     def __str__(self) -> str:
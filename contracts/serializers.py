@@ -45,8 +45,10 @@ class ContratoSerializer(serializers.ModelSerializer):
         """
         Regras simples de consistência de datas e valores.
         """
-        data_inicio = attrs.get("data_inicio_desconto")
-        data_fim = attrs.get("data_fim_desconto")
+        # PATCH parcial: o campo não enviado vale o que já está gravado
+        # (espelha a constraint ck_contrato_datas, que compara a linha inteira)
+        data_inicio = attrs.get("data_inicio_desconto", getattr(self.instance, "data_inicio_desconto", None))
+        data_fim = attrs.get("data_fim_desconto", getattr(self.instance, "data_fim_desconto", None))
         if data_inicio and data_fim and data_inicio > data_fim:
             raise serializers.ValidationError(
                 {"data_fim_desconto": "Data fim não pode ser anterior à data de início do desconto."}
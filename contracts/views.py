@@ -1,6 +1,7 @@
 from rest_framework import viewsets, filters, permissions
 from django_filters.rest_framework import DjangoFilterBackend
 
+from .filters import ContratoFilter
 from .models import Contrato
 from .serializers import ContratoSerializer
 
@@ -17,7 +18,7 @@ class ContratoViewSet(viewsets.ModelViewSet):
 
     # Filtros e ordenação
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ["cliente", "situacao", "origem_averbacao"]
+    filterset_class = ContratoFilter
     search_fields = ["numero_contrato", "banco_nome"]
     ordering_fields = [
         "data_inclusao",
@@ -30,6 +31,18 @@ class ContratoViewSet(viewsets.ModelViewSet):
     ]
     ordering = ["-criado_em"]
 
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if self.action in ("list", "retrieve"):
+            # dos JOINs só saem cliente_nome e usuario_nome; o resto das colunas
+            # de cliente/usuário (search_vec, hash de senha...) fica fora do SELECT
+            qs = qs.only(
+                *(f.name for f in Contrato._meta.concrete_fields),
+                "cliente__nome_completo",
+                "criado_por__username",
+            )
+        return qs
+
     def perform_create(self, serializer):
         # Garante que o usuário autenticado será vinculado automaticamente
         serializer.save(criado_por=self.request.user)
@@ -1,7 +1,30 @@
 # jurisdoc/pagination.py
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 
 class DefaultPagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 100
+
+
+class OptionalCursorPagination(CursorPagination):
+    """
+    Paginação por keyset (cursor) em -criado_em, -id: cada página custa o mesmo que a 1ª.
+    Opcional: só pagina se a requisição trouxer ?cursor= ou ?page_size=; sem eles a
+    listagem continua devolvendo a lista completa (formato atual do front).
+    """
+    ordering = ("-criado_em", "-id")
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def get_ordering(self, request, queryset, view):
+        # o keyset só vale com ordenação única e sobre colunas do próprio model: ao
+        # paginar, ?ordering= (OrderingFilter) é ignorado e vale sempre (-criado_em, -id)
+        return self.ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.cursor_query_param not in params and self.page_size_query_param not in params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
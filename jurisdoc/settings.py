@@ -19,6 +19,11 @@ SECRET_KEY = os.getenv("SECRET_KEY", "dev-unsafe-change-me")
 DEBUG = os.getenv("DEBUG", "0") == "1"  # default OFF; ligue com DEBUG=1 no .env
 ALLOWED_HOSTS = ["*"]
 
+# django-seal: em DEBUG, acesso N+1 em listagens seladas vira erro (em produção só avisa)
+if DEBUG:
+    from seal.exceptions import UnsealedAttributeAccess
+    warnings.filterwarnings("error", category=UnsealedAttributeAccess)
+
 INSTALLED_APPS = [
     "django.contrib.admin",
     "django.contrib.auth",
@@ -26,11 +31,13 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # Third-party
     "rest_framework",
     "corsheaders",
     "django_filters",
     "drf_spectacular",
+    "seal",
     # Apps do projeto
     "accounts",
     "templates_app",
@@ -121,6 +128,11 @@ REST_FRAMEWORK = {
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
+    "DEFAULT_PARSER_CLASSES": (
+        "common.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_FILTER_BACKENDS": ("django_filters.rest_framework.DjangoFilterBackend",),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     # "DEFAULT_PAGINATION_CLASS": "jurisdoc.pagination.DefaultPagination",
@@ -21,7 +21,7 @@ from templates_app.models import Template as DocTemplate
 from templates_app.utils_jinja import extract_jinja_fields, detect_angle_brackets
 
 # Import para buscar a descrição ativa do banco
-from cadastro.models import DescricaoBanco
+from cadastro.models import ContaBancaria, get_descricao_banco_ativa
 
 try:
     from docxtpl import DocxTemplate
@@ -99,21 +99,19 @@ class PetitionViewSet(viewsets.ModelViewSet):
         banco_codigo = (getattr(conta, "banco_codigo", None) or "").strip()
         banco_nome = (getattr(conta, "banco_nome", None) or "").strip()
 
-        qs = DescricaoBanco.objects.filter(is_ativa=True)
-        if banco_codigo:
-            qs = qs.filter(banco_id=banco_codigo)
-        elif banco_nome:
-            qs = qs.filter(banco_nome=self._normalize_bank_name(banco_nome))
-
-        obj = qs.order_by("-atualizado_em").first()
+        # view materializada: já contém só a ativa mais recente de cada banco_id
+        obj = get_descricao_banco_ativa(
+            banco_id=banco_codigo,
+            banco_nome=self._normalize_bank_name(banco_nome) if not banco_codigo else "",
+        )
         if not obj:
             return None
 
         return {
             # usa a descrição personalizada se houver, senão o nome de banco
-            "nome_banco": (obj.nome_banco or obj.banco_nome or banco_nome or "").strip(),
-            "cnpj": (obj.cnpj or "").strip(),
-            "endereco_banco": (obj.endereco or "").strip(),
+            "nome_banco": (obj["nome_banco"] or obj["banco_nome"] or banco_nome or "").strip(),
+            "cnpj": (obj["cnpj"] or "").strip(),
+            "endereco_banco": (obj["endereco"] or "").strip(),
         }
 
     def _format_banco_string(self, desc: dict | None, fallback_nome: str = "") -> str:
@@ -163,7 +161,7 @@ class PetitionViewSet(viewsets.ModelViewSet):
         # Preenche automaticamente dados bancários do cliente
         # ---------------------------------------------------
         if petition.cliente:
-            conta_principal = petition.cliente.contas.filter(is_principal=True).first()
+            conta_principal = ContaBancaria.principal_de(petition.cliente)
             desc_ativa = self._get_banco_descricao_ativa(conta_principal)
 
             # Compatibilidade antiga: campo {{ banco }} (string única)
@@ -16,7 +16,7 @@ from .serializers import TemplateSerializer
 from .utils_jinja import extract_jinja_fields, detect_angle_brackets, find_invalid_jinja_prints
 
 # Import extra
-from cadastro.models import Cliente, DescricaoBanco
+from cadastro.models import Cliente, ContaBancaria, DescricaoBanco
 
 try:
     from docxtpl import DocxTemplate, InlineImage
@@ -95,7 +95,7 @@ class TemplateViewSet(viewsets.ModelViewSet):
         if cliente_id:
             try:
                 cliente = Cliente.objects.get(pk=cliente_id)
-                conta_principal = cliente.contas.filter(is_principal=True).first()
+                conta_principal = ContaBancaria.principal_de(cliente)
                 if conta_principal:
                     # tenta buscar descrição ativa
                     desc = DescricaoBanco.objects.filter(